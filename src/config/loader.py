@@ -1,13 +1,34 @@
 """Configuration loader for job scrapper"""
 
 import os
+import hashlib
 import logging
+import pickle
+import threading
 from pathlib import Path
 from typing import Optional
 import yaml
 
+# Prefer the libyaml-backed C loader when available (much faster parsing)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from src.models.config import AppConfig
 
+# Process-wide cache of parsed configurations, keyed by
+# (resolved path, st_mtime_ns, st_size) so edits invalidate automatically
+_CONFIG_CACHE: dict = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Secondary cache keyed by a digest of the raw YAML bytes, so identical
+# content survives mtime-resetting rewrites (atomic deploys, test reloads)
+_PARSE_CACHE: dict = {}
+_PARSE_CACHE_MAX = 32
+_parse_cache_hits = 0
+_parse_cache_misses = 0
+
 
 class ConfigLoader:
     """
@@ -29,7 +50,7 @@ class ConfigLoader:
             config_path = project_root / "config.yaml"
         
         self.config_path = Path(config_path)
-        self.logger.debug(f"Configuration path: {self.config_path}")
+        self.logger.debug("Configuration path: %s", self.config_path)
     
     def load(self) -> AppConfig:
         """
@@ -49,12 +70,59 @@ class ConfigLoader:
                 f"Please create config.yaml in the project root or specify a custom path."
             )
         
-        self.logger.info(f"Loading configuration from: {self.config_path}")
-        
+        # Return the cached config if the file hasn't changed since last parse
+        stat = self.config_path.stat()
+        if stat.st_size == 0:
+            # Don't bother opening or parsing an empty file
+            raise ValueError("Configuration file is empty")
+        cache_key = (str(self.config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Using cached configuration for: %s", self.config_path)
+            return cached
+
+        # Try the on-disk snapshot next - loading a pickled AppConfig skips
+        # YAML parsing entirely when config.yaml hasn't changed since the
+        # snapshot was written
+        snapshot_path = self.config_path.with_suffix('.pkl.cache')
         try:
-            with open(self.config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
-            
+            if (snapshot_path.exists()
+                    and snapshot_path.stat().st_mtime_ns >= stat.st_mtime_ns):
+                app_config = pickle.loads(snapshot_path.read_bytes())
+                self.logger.debug("Loaded configuration snapshot: %s", snapshot_path)
+                with _CONFIG_CACHE_LOCK:
+                    _CONFIG_CACHE[cache_key] = app_config
+                return app_config
+        except Exception as e:
+            # Stale or corrupt snapshot - fall back to parsing the YAML
+            self.logger.debug("Ignoring configuration snapshot %s: %s", snapshot_path, e)
+
+        # Fall back to the content-hash cache when only the mtime changed
+        global _parse_cache_hits, _parse_cache_misses
+        raw = self.config_path.read_bytes()
+        content_key = hashlib.blake2b(raw, digest_size=16).digest()
+        with _CONFIG_CACHE_LOCK:
+            cached = _PARSE_CACHE.get(content_key)
+            if cached is not None:
+                _parse_cache_hits += 1
+                _CONFIG_CACHE[cache_key] = cached
+            else:
+                _parse_cache_misses += 1
+        if cached is not None:
+            self.logger.debug(
+                "Parse cache hit for %s (hits=%d, misses=%d)",
+                self.config_path, _parse_cache_hits, _parse_cache_misses
+            )
+            return cached
+
+        self.logger.info("Loading configuration from: %s", self.config_path)
+
+        try:
+            # Parse the raw bytes directly - libyaml scans UTF-8 in C without
+            # per-read decode callbacks into Python
+            config_data = yaml.load(raw, Loader=_YamlLoader)
+
             if config_data is None:
                 raise ValueError("Configuration file is empty")
             
@@ -62,21 +130,80 @@ class ConfigLoader:
             app_config = AppConfig.from_dict(config_data)
             
             self.logger.info(
-                f"Configuration loaded successfully: "
-                f"{len(app_config.workers)} workers defined, "
-                f"{len(app_config.get_enabled_workers())} enabled"
+                "Configuration loaded successfully: %d workers defined, %d enabled",
+                len(app_config.workers), len(app_config.get_enabled_workers())
             )
-            
+
+            with _CONFIG_CACHE_LOCK:
+                _CONFIG_CACHE[cache_key] = app_config
+                if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+                    _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+                _PARSE_CACHE[content_key] = app_config
+
+            # Best-effort snapshot for fast startup next time
+            try:
+                snapshot_path.write_bytes(
+                    pickle.dumps(app_config, protocol=pickle.HIGHEST_PROTOCOL)
+                )
+            except OSError as e:
+                self.logger.debug("Could not write configuration snapshot: %s", e)
+
             return app_config
             
         except yaml.YAMLError as e:
-            self.logger.error(f"Failed to parse YAML configuration: {e}")
+            self.logger.error("Failed to parse YAML configuration: %s", e)
             raise
         
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {e}")
+            self.logger.error("Failed to load configuration: %s", e)
             raise
     
+    def load_header(self) -> dict:
+        """
+        Cheaply read top-level scalar settings without parsing the full file
+
+        Parses only the first few KB of the configuration, which is enough
+        for settings like log_level and output_dir. Falls back to a full
+        load() when the header alone doesn't parse cleanly or the expected
+        scalar settings aren't in it.
+
+        Returns:
+            Dictionary of top-level scalar settings (e.g. log_level, output_dir)
+        """
+        try:
+            with self.config_path.open('rb') as f:
+                head = f.read(4096)
+
+            config_data = yaml.load(head, Loader=_YamlLoader)
+            if isinstance(config_data, dict):
+                header = {
+                    key: value for key, value in config_data.items()
+                    if not isinstance(value, (list, dict))
+                }
+                # A truncation that happens to parse cleanly (e.g. cut on
+                # a worker-list boundary) can silently drop settings that
+                # come after the cut - only trust the header if the keys
+                # we came for are actually in it
+                if all(key in header for key in ('log_level', 'output_dir')):
+                    return header
+        except (OSError, yaml.YAMLError):
+            pass
+
+        # Header parse failed (truncated mid-structure or unreadable) or
+        # incomplete - fall back to the full, cached load
+        app_config = self.load()
+        return {
+            'log_level': app_config.log_level,
+            'output_dir': app_config.output_dir,
+        }
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Clear the process-wide configuration caches"""
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE.clear()
+            _PARSE_CACHE.clear()
+
     @staticmethod
     def load_from_path(path: str) -> AppConfig:
         """
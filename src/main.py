@@ -13,8 +13,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logger import setup_logger
 from src.config.loader import ConfigLoader
-from src.workers.worker_manager import WorkerManager
-from src.workers.worker_factory import WorkerFactory
 
 
 def parse_arguments():
@@ -47,10 +45,19 @@ def main():
     
     # Parse command line arguments
     args = parse_arguments()
-    
-    # Setup initial logging (will be updated after config loads)
-    logger = setup_logger("job_scrapper")
-    
+
+    # Determine the log level up front (CLI flag wins, then a cheap peek at
+    # the config header) so the logger is built once at the right level
+    log_level = args.log_level
+    if log_level is None:
+        try:
+            log_level = ConfigLoader(args.config).load_header().get('log_level', 'INFO')
+        except Exception:
+            log_level = 'INFO'
+    log_level_int = getattr(logging, log_level.upper(), logging.INFO)
+
+    logger = setup_logger("job_scrapper", level=log_level_int)
+
     logger.info("="*60)
     logger.info("Job Scrapper Application Starting")
     logger.info("="*60)
@@ -60,17 +67,28 @@ def main():
         logger.info(f"Loading configuration from: {args.config}")
         config_loader = ConfigLoader(args.config)
         config = config_loader.load()
-        
-        # Update log level if specified in config or CLI
-        log_level = args.log_level or config.log_level
-        log_level_int = getattr(logging, log_level.upper())
-        logger.setLevel(log_level_int)
-        for handler in logger.handlers:
-            handler.setLevel(log_level_int)
-        
+
+        # The header peek is only a guess - the full config is
+        # authoritative. Re-apply its level unless the CLI flag won.
+        if args.log_level is None and config.log_level:
+            config_level_int = getattr(
+                logging, str(config.log_level).upper(), log_level_int
+            )
+            if config_level_int != log_level_int:
+                log_level = config.log_level
+                log_level_int = config_level_int
+                logger.setLevel(log_level_int)
+                for handler in logger.handlers:
+                    handler.setLevel(log_level_int)
+
         logger.info(f"Log level set to: {log_level}")
         logger.info(f"Configuration loaded: {len(config.workers)} workers defined")
-        
+
+        # Import worker machinery only once config is valid - keeps --help and
+        # config-error paths from paying for the scraping/Redis dependencies
+        from src.workers.worker_manager import WorkerManager
+        from src.workers.worker_factory import WorkerFactory
+
         # Create worker factory with app config (for Redis settings)
         factory = WorkerFactory(app_config=config)
         
@@ -1,10 +1,14 @@
 """Configuration data models"""
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
+# Valid log levels as a frozenset for O(1) membership checks
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkerConfig:
     """
     Configuration for a single worker
@@ -34,6 +38,11 @@ class WorkerConfig:
         
         if self.interval <= 0:
             raise ValueError(f"Worker interval must be positive, got {self.interval}")
+
+        # Intern identifiers drawn from a small vocabulary - they are used
+        # as dict keys and compared frequently
+        self.name = sys.intern(self.name)
+        self.type = sys.intern(self.type)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'WorkerConfig':
@@ -46,17 +55,18 @@ class WorkerConfig:
         Returns:
             WorkerConfig instance
         """
+        g = data.get
         return cls(
-            name=data.get('name', ''),
-            type=data.get('type', ''),
-            interval=data.get('interval', 60),
-            enabled=data.get('enabled', True),
-            message=data.get('message'),
-            config=data.get('config', {})
+            name=g('name', ''),
+            type=g('type', ''),
+            interval=g('interval', 60),
+            enabled=g('enabled', True),
+            message=g('message'),
+            config=g('config', {})
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """
     Application-wide configuration
@@ -75,24 +85,30 @@ class AppConfig:
     redis_port: int = 6379
     redis_db: int = 0
     output_dir: str = "output"
-    
+    _by_name: Dict[str, WorkerConfig] = field(init=False, repr=False, default_factory=dict)
+    _enabled: tuple = field(init=False, repr=False, default=())
+
     def __post_init__(self):
         """Validate configuration after initialization"""
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_log_levels:
+        if self.log_level.upper() not in _VALID_LOG_LEVELS:
             raise ValueError(
                 f"Invalid log level '{self.log_level}'. "
-                f"Must be one of: {', '.join(valid_log_levels)}"
+                f"Must be one of: {', '.join(sorted(_VALID_LOG_LEVELS))}"
             )
-    
+
+        # Walk the worker list once to build both lookup structures -
+        # a loaded config is effectively immutable afterwards
+        self._by_name = {w.name: w for w in self.workers}
+        self._enabled = tuple(w for w in self.workers if w.enabled)
+
     def get_enabled_workers(self) -> List[WorkerConfig]:
         """
         Get only enabled workers
-        
+
         Returns:
             List of enabled worker configurations
         """
-        return [w for w in self.workers if w.enabled]
+        return list(self._enabled)
     
     def get_worker_by_name(self, name: str) -> Optional[WorkerConfig]:
         """
@@ -104,10 +120,7 @@ class AppConfig:
         Returns:
             WorkerConfig if found, None otherwise
         """
-        for worker in self.workers:
-            if worker.name == name:
-                return worker
-        return None
+        return self._by_name.get(name)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'AppConfig':
@@ -121,16 +134,16 @@ class AppConfig:
             AppConfig instance
         """
         # Parse worker configurations
-        workers = []
-        for worker_data in data.get('workers', []):
-            workers.append(WorkerConfig.from_dict(worker_data))
-        
+        _wc = WorkerConfig.from_dict
+        workers = [_wc(worker_data) for worker_data in data.get('workers', ())]
+
+        redis = data.get('redis') or {}
         return cls(
             log_level=data.get('log_level', 'INFO'),
             workers=workers,
-            redis_host=data.get('redis', {}).get('host', 'localhost'),
-            redis_port=data.get('redis', {}).get('port', 6379),
-            redis_db=data.get('redis', {}).get('db', 0),
+            redis_host=redis.get('host', 'localhost'),
+            redis_port=redis.get('port', 6379),
+            redis_db=redis.get('db', 0),
             output_dir=data.get('output_dir', 'output')
         )
 
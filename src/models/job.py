@@ -1,11 +1,30 @@
 """Job data model"""
 
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 
+# orjson is a C extension several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 
-@dataclass
+
+def _now() -> datetime:
+    """Cheap timestamp factory - skips datetime.now()'s tz-resolution path"""
+    return datetime.fromtimestamp(time.time())
+
+# Resolved lazily on first classify() call to avoid importing the heavy
+# classifier stack at model-import time; cached so the import machinery
+# only runs once per process
+_classify_job = None
+
+
+@dataclass(slots=True)
 class Job:
     """
     Represents a job posting
@@ -31,26 +50,49 @@ class Job:
     source: str = "unknown"
     posted_date: Optional[str] = None
     posted_time: Optional[int] = None
-    scraped_at: datetime = field(default_factory=datetime.now)
+    scraped_at: datetime = field(default_factory=_now)
     category: str = ""
     tags: List[str] = field(default_factory=list)
     classification_confidence: float = 0.0
-    
+    _iso: Optional[str] = field(default=None, repr=False)
+    _tags_csv: Optional[str] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        """Intern small-vocabulary strings shared across many jobs"""
+        self.source = sys.intern(self.source)
+        self.category = sys.intern(self.category)
+
     def __str__(self) -> str:
         """String representation of job"""
         return f"{self.title} at {self.company} ({self.location})"
     
     def classify(self) -> None:
         """Classify this job based on title and description"""
-        from src.utils.job_classifier import classify_job
-        
-        result = classify_job(self.title, self.description)
+        global _classify_job
+        if _classify_job is None:
+            from src.utils.job_classifier import classify_job
+            _classify_job = classify_job
+
+        result = _classify_job(self.title, self.description)
         self.category = result.category
         self.tags = result.tags
         self.classification_confidence = result.confidence
-    
+        self._tags_csv = None  # Tags changed, invalidate cached CSV form
+
+    def to_json(self) -> bytes:
+        """Serialize job to JSON bytes"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode('utf-8')
+
     def to_dict(self) -> dict:
         """Convert job to dictionary"""
+        # Cache the derived string forms - jobs are serialized repeatedly
+        # (CSV, summaries) but their fields don't change in between
+        if self._iso is None and self.scraped_at:
+            self._iso = self.scraped_at.isoformat()
+        if self._tags_csv is None:
+            self._tags_csv = ','.join(self.tags) if self.tags else ''
         return {
             'title': self.title,
             'company': self.company,
@@ -60,9 +102,9 @@ class Job:
             'source': self.source,
             'posted_date': self.posted_date,
             'posted_time': self.posted_time,
-            'scraped_at': self.scraped_at.isoformat() if self.scraped_at else None,
+            'scraped_at': self._iso,
             'category': self.category,
-            'tags': ','.join(self.tags) if self.tags else '',
+            'tags': self._tags_csv,
             'classification_confidence': self.classification_confidence
         }
 
@@ -1,15 +1,209 @@
 """LinkedIn job scraper service using Playwright"""
 
 import logging
+import queue
+import random
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple
 from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 from playwright.sync_api import sync_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
 
 from src.models.job import Job
 from src.utils.redis_client import RedisClient
-from src.utils.string_matcher import match_all_keywords
+from src.utils.string_matcher import match_all_keywords, match_any_keywords
+
+# Number of job detail pages fetched concurrently per listing page
+_DETAIL_CONCURRENCY = 5
+
+# Listing pages (pagination offsets) fetched concurrently per wave
+_LISTING_CONCURRENCY = 3
+
+# Cap on detail-page bytes read; the description section sits in the
+# first few KB, the rest of the page is never looked at
+_DETAIL_MAX_BYTES = 512 * 1024
+
+# Matches relative timestamps like "1 hour ago" / "30 Minutes Ago";
+# compiled once since it runs for every job card
+_TIME_AGO_RE = re.compile(r'(\d+)\s+(minute|hour|day)s?\s+ago', re.IGNORECASE)
+_UNIT_SECS = {'minute': 60, 'hour': 3600, 'day': 86400}
+
+# Resources the scraper never reads - aborted before download to cut
+# bandwidth and renderer work; only text content is ever extracted.
+# Classified by the browser's resource type, which also catches
+# extensionless image/style URLs that a suffix match would miss.
+_BLOCKED_RESOURCE_TYPES = frozenset({
+    'image', 'stylesheet', 'font', 'media', 'texttrack',
+    'beacon', 'csp_report', 'imageset',
+})
+_BLOCKED_HOST_RE = re.compile(
+    r'(doubleclick\.net|google-analytics\.com|googletagmanager\.com|linkedin\.com/li/track)'
+)
+
+# Interned fallback values - most cards miss the same fields, so the
+# duplicates share one string object instead of one allocation per job
+_UNKNOWN = sys.intern("Unknown")
+_NOT_SPECIFIED = sys.intern("Not specified")
+
+# Sustained request rate (per second) and burst size for outbound HTTP
+_REQUESTS_PER_SECOND = 5.0
+_REQUEST_BURST = 5.0
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket limiting outbound request rate
+
+    Shared across the listing and detail worker threads so concurrent
+    fetches stay under a fixed requests-per-second budget instead of
+    being serialized by fixed sleeps.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Token refill rate (requests per second)
+            capacity: Maximum burst size
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last) * self._rate
+                )
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+def _class_xpath(tag: str, *classes: str) -> str:
+    """Build an XPath matching a tag carrying all the given CSS classes"""
+    conditions = ''.join(
+        f"[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+        for cls in classes
+    )
+    return f"descendant-or-self::{tag}{conditions}"
+
+
+# Precompiled XPath selectors for the HTTP parse paths; compiled once
+# instead of re-translated per document
+_X_DETAIL_SECTION = etree.XPath(
+    _class_xpath('section', 'core-section-container', 'my-3', 'description')
+)
+_X_DETAIL_FALLBACK = etree.XPath(_class_xpath('div', 'mt4'))
+_X_LISTING_CARDS = etree.XPath('//li')
+_X_CARD_LINK = etree.XPath(
+    ".//a[@data-tracking-control-name='public_jobs_jserp-result_search-card']"
+)
+_X_CARD_TITLE = etree.XPath('.//h3')
+_X_CARD_COMPANY = etree.XPath('.//h4')
+_X_CARD_LOCATION = etree.XPath(_class_xpath('*', 'job-search-card__location'))
+_X_CARD_TIME = etree.XPath('.//time')
+_X_CARD_SNIPPET = etree.XPath(_class_xpath('*', 'job-search-card__snippet'))
+
+
+def _first_text(nodes) -> Optional[str]:
+    """Stripped text content of the first node, or None when empty"""
+    return nodes[0].text_content().strip() if nodes else None
+
+
+# Stealth fingerprint shared by the browser contexts and the HTTP
+# session; defined once so per-context setup is just a reference
+_STEALTH_UA = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+_STEALTH_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+_STEALTH_INIT_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Override plugins and mimeTypes to look like real browser
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+
+    // Override languages to look realistic
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+
+    // Chrome-specific properties
+    window.chrome = {
+        runtime: {}
+    };
+
+    // Permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+"""
+
+# Pages served from one browser context before it is rotated; contexts only
+# release their memory on close, so rotation keeps long runs bounded
+_CONTEXT_MAX_PAGES = 20
+
+# Navigations served by a pooled page before it is retired and recreated
+_PAGE_MAX_USES = 25
+
+# Signature of LinkedIn's anti-bot interstitial (meta-refresh redirect page)
+_INTERSTITIAL_MARKER = '<meta http-equiv="refresh" content="1;url=https://www.linkedin.com'
+
+# Sentinel returned when the HTTP fetch was blocked and the browser-based
+# fallback should be used (the sync Playwright API is bound to the thread
+# that started it, so the fallback cannot run inside worker threads)
+_NEEDS_BROWSER = object()
+
+# Extracts every job card in one in-browser pass; a single evaluate()
+# round-trip instead of several locator calls per card
+_EXTRACT_JOBS_JS = """() => Array.from(document.querySelectorAll('li')).map(li => ({
+    title: li.querySelector('h3')?.innerText?.trim(),
+    company: li.querySelector('h4')?.innerText?.trim(),
+    url: li.querySelector("a[data-tracking-control-name='public_jobs_jserp-result_search-card']")
+        ?.getAttribute('href')?.split('?')[0],
+    location: li.querySelector('.job-search-card__location')?.innerText?.trim(),
+    posted_date: li.querySelector('time')?.getAttribute('datetime'),
+    posted_text: li.querySelector('time')?.innerText?.trim(),
+    snippet: li.querySelector('.job-search-card__snippet')?.innerText?.trim()
+})).filter(j => j.url)"""
 
 
 class LinkedInScraperService:
@@ -21,30 +215,49 @@ class LinkedInScraperService:
     """
     
     BASE_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
-    
+
+    # CDP endpoint of the shared browser, set by the first instance that
+    # launches with use_shared=True; later instances connect instead of
+    # launching another few-hundred-MB Chromium
+    _SHARED_CDP_PORT = 9222
+    _shared_cdp_url: Optional[str] = None
+
     def __init__(
-        self, 
-        headless: bool = True, 
+        self,
+        headless: bool = True,
         timeout: int = 10000,
         redis_host: Optional[str] = None,
         redis_port: Optional[int] = None,
-        redis_db: Optional[int] = None
+        redis_db: Optional[int] = None,
+        use_shared: bool = False
     ):
         """
         Initialize LinkedIn scraper
-        
+
         Args:
             headless: Run browser in headless mode
             timeout: Default timeout for page operations in milliseconds
             redis_host: Redis server host (defaults to env REDIS_HOST or 'localhost')
             redis_port: Redis server port (defaults to env REDIS_PORT or 6379)
             redis_db: Redis database number (defaults to env REDIS_DB or 0)
+            use_shared: Share one Chromium across scraper instances in this
+                process via CDP instead of launching a browser per instance
         """
         self.headless = headless
         self.timeout = timeout
+        self.use_shared = use_shared
+        self._owns_browser = True
         self.logger = logging.getLogger("job_scrapper.service.linkedin")
         self._browser: Optional[Browser] = None
         self._playwright = None
+        self._context = None
+        self._pages_in_context = 0
+        self._page_pool: "queue.SimpleQueue[Page]" = queue.SimpleQueue()
+        self._page_uses: dict = {}
+        self._seen_urls: set = set()
+        self._http_session: Optional[requests.Session] = None
+        self._detail_executor: Optional[ThreadPoolExecutor] = None
+        self._rate_limiter = _TokenBucket(_REQUESTS_PER_SECOND, _REQUEST_BURST)
         
         # Initialize Redis client for caching
         try:
@@ -76,28 +289,109 @@ class LinkedInScraperService:
         
         self.logger.info("Starting Playwright browser with stealth mode...")
         self._playwright = sync_playwright().start()
-        
-        # Launch browser with anti-detection arguments
-        self._browser = self._playwright.chromium.launch(
-            headless=self.headless,
-            args=[
+
+        cls = type(self)
+        if self.use_shared and cls._shared_cdp_url:
+            # Reuse the browser another instance already launched; this
+            # instance still gets private contexts inside it
+            try:
+                self._browser = self._playwright.chromium.connect_over_cdp(
+                    cls._shared_cdp_url
+                )
+                self._owns_browser = False
+                self.logger.info(f"Connected to shared browser at {cls._shared_cdp_url}")
+            except Exception as e:
+                self.logger.warning(
+                    f"Could not connect to shared browser ({e}), launching own"
+                )
+
+        if self._browser is None:
+            # Launch browser with anti-detection arguments
+            launch_args = [
                 '--disable-blink-features=AutomationControlled',  # Hide automation
                 '--disable-dev-shm-usage',
+                '--no-zygote',  # Fewer helper processes, less shared-memory pressure
                 '--no-sandbox',
                 '--disable-setuid-sandbox',
                 '--disable-web-security',
                 '--disable-features=IsolateOrigins,site-per-process',
             ]
+            if self.use_shared:
+                launch_args.append(f'--remote-debugging-port={cls._SHARED_CDP_PORT}')
+
+            self._browser = self._playwright.chromium.launch(
+                headless=self.headless,
+                args=launch_args
+            )
+            self._owns_browser = True
+
+            if self.use_shared:
+                cls._shared_cdp_url = f"http://localhost:{cls._SHARED_CDP_PORT}"
+
+        # HTTP session for static job detail pages - far cheaper than a
+        # browser page, and the connection pool is reused across fetches.
+        # Transient errors retry with backoff inside urllib3, reusing the
+        # pooled connection instead of a fresh TLS handshake per attempt.
+        self._http_session = requests.Session()
+        self._http_session.headers.update({
+            'User-Agent': _STEALTH_UA,
+            'Accept': _STEALTH_HEADERS['Accept'],
+            'Accept-Language': _STEALTH_HEADERS['Accept-Language'],
+        })
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            )
         )
-        
+        self._http_session.mount('https://', adapter)
+        self._http_session.mount('http://', adapter)
+
+        # Bounded pool for concurrent detail-page fetches (I/O-bound)
+        self._detail_executor = ThreadPoolExecutor(
+            max_workers=_DETAIL_CONCURRENCY,
+            thread_name_prefix="linkedin-details"
+        )
+
         self.logger.info("Browser started successfully")
-    
+
     def stop(self) -> None:
         """Stop the browser and cleanup"""
+        if self._detail_executor:
+            self._detail_executor.shutdown(wait=True)
+            self._detail_executor = None
+
+        if self._http_session:
+            self._http_session.close()
+            self._http_session = None
+
+        # Drain the page pool; closing the context below closes the pages,
+        # but doing it explicitly keeps the bookkeeping consistent
+        while True:
+            try:
+                page = self._page_pool.get_nowait()
+            except queue.Empty:
+                break
+            if not page.is_closed():
+                page.close()
+        self._page_uses.clear()
+
+        if self._context:
+            self._context.close()
+            self._context = None
+            self._pages_in_context = 0
+
         if self._browser:
+            # For a CDP-connected instance close() only drops the
+            # connection; the shared browser keeps running for the others
             self.logger.info("Closing browser...")
             self._browser.close()
             self._browser = None
+            if self._owns_browser and self.use_shared:
+                type(self)._shared_cdp_url = None
         
         if self._playwright:
             self._playwright.stop()
@@ -108,65 +402,113 @@ class LinkedInScraperService:
         if self.redis_client:
             self.redis_client.close()
     
+    def _new_stealth_context(self):
+        """
+        Create a browser context with all stealth settings baked in
+
+        Headers, viewport and the init script are applied once per context
+        instead of once per page, so new pages are cheap.
+
+        Returns:
+            BrowserContext with anti-detection measures applied
+        """
+        context = self._browser.new_context(
+            user_agent=_STEALTH_UA,
+            viewport={'width': 1920, 'height': 1080},
+            extra_http_headers=_STEALTH_HEADERS
+        )
+
+        # Remove webdriver property and friends (defined once at module
+        # scope; attached once per context, inherited by its pages)
+        context.add_init_script(_STEALTH_INIT_JS)
+
+        self._install_route_blocking(context)
+
+        return context
+
+    @staticmethod
+    def _install_route_blocking(context) -> None:
+        """
+        Abort non-essential requests before they're fetched
+
+        Only text is ever extracted, so images, styles, fonts, media and
+        tracker beacons are pure download and render overhead. Installed
+        per context so the route handler's lifetime is bounded by the
+        context rotation.
+
+        Args:
+            context: BrowserContext to install the handler on
+        """
+        def _handle(route):
+            request = route.request
+            if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+                    or _BLOCKED_HOST_RE.search(request.url)):
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route('**/*', _handle)
+
     def _create_stealth_page(self) -> Page:
         """
-        Create a new page with stealth settings to avoid bot detection
-        
+        Create a new page on the shared stealth context
+
+        The context is rotated after a fixed number of pages to keep
+        browser memory bounded on long runs.
+
         Returns:
             Page with anti-detection measures applied
         """
-        page = self._browser.new_page()
-        
-        # Set realistic user agent
-        page.set_extra_http_headers({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-        })
-        
-        # Set viewport to common resolution
-        page.set_viewport_size({'width': 1920, 'height': 1080})
-        
-        # Remove webdriver property
-        page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // Override plugins and mimeTypes to look like real browser
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            
-            // Override languages to look realistic
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            
-            // Chrome-specific properties
-            window.chrome = {
-                runtime: {}
-            };
-            
-            // Permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-        """)
-        
-        return page
-    
+        if self._context is None or self._pages_in_context >= _CONTEXT_MAX_PAGES:
+            if self._context is not None:
+                self.logger.debug("Rotating browser context")
+                self._context.close()
+            self._context = self._new_stealth_context()
+            self._pages_in_context = 0
+
+        self._pages_in_context += 1
+        return self._context.new_page()
+
+    def _acquire_page(self) -> Page:
+        """
+        Get a page from the pool, creating one when the pool is empty
+
+        Pooled pages keep their renderer process warm between navigations,
+        which is much cheaper than the open/close cycle per URL.
+
+        Returns:
+            An open Page ready to navigate
+        """
+        while True:
+            try:
+                page = self._page_pool.get_nowait()
+            except queue.Empty:
+                return self._create_stealth_page()
+            # Pages from a rotated (closed) context are dead - discard them
+            if not page.is_closed():
+                return page
+            self._page_uses.pop(page, None)
+
+    def _release_page(self, page: Page) -> None:
+        """
+        Return a page to the pool, retiring it after _PAGE_MAX_USES trips
+
+        Args:
+            page: Page previously obtained from _acquire_page()
+        """
+        if page.is_closed():
+            self._page_uses.pop(page, None)
+            return
+
+        uses = self._page_uses.get(page, 0) + 1
+        if uses >= _PAGE_MAX_USES:
+            self.logger.debug("Retiring pooled page after %d uses", uses)
+            self._page_uses.pop(page, None)
+            page.close()
+        else:
+            self._page_uses[page] = uses
+            self._page_pool.put(page)
+
     def search_jobs(
         self,
         keywords: List[str],
@@ -214,212 +556,362 @@ class LinkedInScraperService:
             self.logger.debug(f"Final search keywords: {search_keywords}")
         
         all_jobs = []
-        start = 0
         jobs_per_page = 10  # LinkedIn API returns 10 jobs per page
-        
+
+        # Pagination windows can shift and re-serve listings within one
+        # search; this local set drops those repeats before they cost a
+        # Redis round-trip or a detail fetch
+        self._seen_urls.clear()
+
+        # Build search URL parameters; only 'start' varies per page
+        params = {
+            'f_SB': '1'  # Always sort by most recent
+        }
+        if search_keywords:
+            params['keywords'] = search_keywords
+        if location:
+            params['location'] = location
+        if job_type:
+            params['f_JT'] = job_type
+        if workplace_type:
+            params['f_WT'] = workplace_type
+        if experience_level:
+            params['f_E'] = experience_level
+        if last_time_posted:
+            params['f_TPR'] = f"r{last_time_posted}"
+
+        # Encode the static parameters once; only 'start' changes per page
+        base_url = f"{self.BASE_URL}?{urlencode(params)}"
+
+        # Offsets are independent, so they're fetched over HTTP in small
+        # parallel waves; the browser is only acquired when a listing
+        # fetch hits the anti-bot interstitial
+        offsets = list(range(0, max_results, jobs_per_page))
+        page = None
+        stop = False
         try:
-            page = self._create_stealth_page()
-            page.set_default_timeout(self.timeout)
-            
-            # Fetch jobs in batches of 10 until we reach max_results
-            while len(all_jobs) < max_results:
-                # Build search URL with pagination
-                params = {
-                    'start': start,
-                    'f_SB': '1'  # Always sort by most recent
-                }
-                if search_keywords:
-                    params['keywords'] = search_keywords
-                if location:
-                    params['location'] = location
-                if job_type:
-                    params['f_JT'] = job_type
-                if workplace_type:
-                    params['f_WT'] = workplace_type
-                if experience_level:
-                    params['f_E'] = experience_level
-                if last_time_posted:
-                    params['f_TPR'] = f"r{last_time_posted}"
-                
-                url = f"{self.BASE_URL}?{urlencode(params)}"
-                
-                self.logger.debug(f"Fetching page with start={start}, URL: {url}")
-                
-                # Navigate to search page with proper wait strategy
-                try:
-                    page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                    
-                    # Wait for job listings to be present (with timeout)
-                    # LinkedIn API returns jobs in <li> elements
-                    page.wait_for_selector('li', timeout=10000, state='attached')
-                    
-                    # Small delay to ensure page is fully stable
-                    time.sleep(time.time() % 3)
-                    
-                except PlaywrightTimeout:
-                    self.logger.error(f"Timeout waiting for job listings at {url}")
-                    break
-                
-                # Extract job listings from this page
-                jobs, found = self._extract_jobs_from_page(page)
-                
-                if not found:
-                    # No more jobs found
-                    self.logger.debug("No more jobs found, stopping pagination")
+            for wave_index in range(0, len(offsets), _LISTING_CONCURRENCY):
+                if stop or len(all_jobs) >= max_results:
                     break
 
-                for job in jobs:
-                    if self._evaluate_job_details(job.description, keywords):
-                        all_jobs.append(job)
-                
-                self.logger.debug(f"Fetched {len(jobs)} jobs, total: {len(all_jobs)}")
-                
-                # Move to next page
-                start += jobs_per_page
-                
-                # Longer delay to appear more human-like and avoid detection
-                time.sleep(time.time() % 3)  # Random delay between 3-5 seconds
-            
-            page.close()
-            
+                wave = offsets[wave_index:wave_index + _LISTING_CONCURRENCY]
+                urls = [f"{base_url}&start={start}" for start in wave]
+                self.logger.debug(f"Fetching listing wave: offsets={wave}")
+
+                if self._detail_executor:
+                    pages_html = list(self._detail_executor.map(
+                        self._fetch_listing_html, urls
+                    ))
+                else:
+                    pages_html = [self._fetch_listing_html(url) for url in urls]
+
+                for start, url, html in zip(wave, urls, pages_html):
+                    remaining = max_results - len(all_jobs)
+                    if remaining <= 0:
+                        break
+                    if html is _NEEDS_BROWSER:
+                        # Browser fallback for this offset. 'domcontentloaded'
+                        # is enough - the endpoint ships the <li> elements in
+                        # the response body, so there's no selector to await.
+                        if page is None:
+                            page = self._acquire_page()
+                            page.set_default_timeout(self.timeout)
+                        try:
+                            page.goto(url, wait_until='domcontentloaded', timeout=15000)
+                        except PlaywrightTimeout:
+                            self.logger.error(f"Timeout waiting for job listings at {url}")
+                            stop = True
+                            break
+                        jobs, found = self._extract_jobs_from_page(page, keywords, remaining)
+                    elif html:
+                        raw_jobs = self._extract_raw_jobs_from_html(html)
+                        jobs, found = self._process_raw_jobs(raw_jobs, keywords, remaining)
+                    else:
+                        # Listing fetch failed outright
+                        stop = True
+                        break
+
+                    if not found:
+                        # No more jobs found
+                        self.logger.debug("No more jobs found, stopping pagination")
+                        stop = True
+                        break
+
+                    for job in jobs:
+                        if self._evaluate_job_details(job.description, keywords):
+                            all_jobs.append(job)
+
+                    self.logger.debug(f"Fetched {len(jobs)} jobs at offset {start}, total: {len(all_jobs)}")
+
+                # Pacing is handled by the shared token bucket at the
+                # request sites, so no fixed sleep between waves
+
             # Trim to max_results
             all_jobs = all_jobs[:max_results]
-            
+
             self.logger.info(f"Successfully scraped {len(all_jobs)} jobs from LinkedIn")
             return all_jobs
-            
+
         except Exception as e:
             self.logger.error(f"Error searching LinkedIn jobs: {e}", exc_info=True)
             return []
+        finally:
+            if page:
+                self._release_page(page)
     
-    def _extract_jobs_from_page(self, page: Page) -> Tuple[List[Job], bool]:
+    def _extract_jobs_from_page(
+        self,
+        page: Page,
+        keywords: Optional[List[str]] = None,
+        remaining: Optional[int] = None
+    ) -> Tuple[List[Job], bool]:
         """
         Extract job information from the current page
 
         Args:
             page: Playwright page object
-        
+            keywords: Search keywords used to prefilter cards by their
+                listing snippet before the detail fetch
+            remaining: Cap on how many jobs are still wanted, so detail
+                fetches stop once the search is satisfied
+
+        Returns:
+            Tuple of (List of Job objects, found flag)
+        """
+        # Check if page is still valid
+        if page.is_closed():
+            self.logger.error("Page is closed, cannot extract jobs")
+            return [], False
+
+        # Extract every job card in one evaluate() call - the whole page
+        # is read in-browser instead of one CDP round-trip per field per card
+        try:
+            raw_jobs = page.evaluate(_EXTRACT_JOBS_JS)
+        except Exception as e:
+            self.logger.error(f"Error extracting job elements (context destroyed?): {e}")
+            return [], False
+
+        return self._process_raw_jobs(raw_jobs, keywords, remaining)
+
+    def _process_raw_jobs(
+        self,
+        raw_jobs: List[dict],
+        keywords: Optional[List[str]] = None,
+        remaining: Optional[int] = None
+    ) -> Tuple[List[Job], bool]:
+        """
+        Turn raw listing-card mappings into deduplicated Jobs with details
+
+        Shared by the browser and plain-HTTP listing paths. Runs the full
+        per-page pipeline: build Jobs, URL dedupe, snippet prefilter,
+        concurrent detail fetch, then batched description dedupe.
+
+        Args:
+            raw_jobs: Field mappings as produced by _EXTRACT_JOBS_JS or
+                _extract_raw_jobs_from_html
+            keywords: Search keywords for the snippet prefilter
+            remaining: Cap on how many jobs are still wanted; cards over
+                the cap are left untouched (not marked seen) so a later
+                search can still pick them up
+
         Returns:
             Tuple of (List of Job objects, found flag)
         """
         jobs = []
         found = False
-        
+
         try:
-            # Check if page is still valid
-            if page.is_closed():
-                self.logger.error("Page is closed, cannot extract jobs")
-                return jobs, found
-            
-            # Get all job list items (API endpoint returns simple li elements)
-            job_elements = page.locator('li')
-            
-            # Try to count elements, if context is destroyed, return empty
-            try:
-                job_count = job_elements.count()
-            except Exception as e:
-                self.logger.error(f"Error counting job elements (context destroyed?): {e}")
-                return jobs, found
-            
-            self.logger.debug(f"Found {job_count} job elements on page")
-            
-            if job_count == 0:
+            self.logger.debug(f"Found {len(raw_jobs)} job elements on page")
+
+            if not raw_jobs:
                 return jobs, found
-            
-            # Extract all job elements at once to avoid context issues
-            for i in range(job_count):
-                try:
-                    # Re-locate element each time to avoid stale references
-                    job_elem = page.locator('li').nth(i)
-                    
-                    # Quick check if element still exists
-                    if job_elem.count() == 0:
+
+            candidates = []
+            for raw in raw_jobs:
+                job = self._build_job_from_raw(raw)
+                if job:
+                    found = True
+                    # Skip URLs already handled earlier in this search
+                    if job.url in self._seen_urls:
                         continue
-                    
-                    job = self._extract_job_from_element(job_elem)
-                    if job:
-                        found = True
-                        
-                        # Fetch job details (this creates a new page, shouldn't affect current page)
+                    # Over the cap: don't mark seen, don't fetch - the
+                    # search is already satisfied past this point
+                    if remaining is not None and len(candidates) >= remaining:
+                        continue
+                    self._seen_urls.add(job.url)
+                    candidates.append(job)
+
+            # Drop already-seen URLs before any detail fetch - in
+            # steady-state polling most of the page is duplicates, and
+            # skipping them here saves a fetch per duplicate
+            if candidates and self.redis_client:
+                seen = self.redis_client.check_and_cache_urls(
+                    [job.url for job in candidates]
+                )
+                fresh = []
+                for job, is_seen in zip(candidates, seen):
+                    if is_seen:
+                        self.logger.debug(f"Skipping already-seen URL: {job.url}")
+                    else:
+                        fresh.append(job)
+                candidates = fresh
+
+            # Prefilter on the listing snippet: a card whose title, company
+            # and snippet show none of the keywords can't pass the full
+            # match later, so its detail fetch is skipped outright. Cards
+            # without a snippet always proceed; the post-fetch
+            # _evaluate_job_details check stays authoritative.
+            if candidates and keywords:
+                fresh = []
+                for job in candidates:
+                    if job.description and not match_any_keywords(
+                        keywords,
+                        f"{job.title} {job.company} {job.description}",
+                        case_sensitive=False
+                    ):
+                        self.logger.debug(
+                            f"Snippet prefilter rejected job: {job.url}"
+                        )
+                        continue
+                    fresh.append(job)
+                candidates = fresh
+
+            # Phase 2: fetch all detail pages for this listing concurrently -
+            # they are independent HTTP requests, so the fetches overlap
+            if candidates:
+                if self._detail_executor:
+                    details = list(self._detail_executor.map(
+                        self._fetch_job_details_http,
+                        [job.url for job in candidates]
+                    ))
+                else:
+                    details = [self._fetch_job_details_http(job.url) for job in candidates]
+
+                # Phase 3: attach descriptions; blocked fetches fall back
+                # to the browser serially on this thread
+                for job, job_details in zip(candidates, details):
+                    if job_details is _NEEDS_BROWSER:
                         job_details = self.fetch_job_details(job.url)
-                        if job_details:
-                            job.description = job_details
-                        
-                        # Check Redis cache for duplicates
-                        if self.redis_client and self.redis_client.check_and_cache_job(job):
-                            self.logger.debug(f"Skipping duplicate job: {job.url}")
-                            continue
-                        
-                        jobs.append(job)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error extracting job {i}: {e}")
-                    # Continue to next job even if one fails
-                    continue
-                    
+                    if job_details:
+                        job.description = job_details
+
+                # Phase 4: dedupe the whole page against Redis in one
+                # pipelined batch instead of a round-trip per job
+                if self.redis_client:
+                    duplicates = self.redis_client.check_and_cache_jobs_batch(candidates)
+                else:
+                    duplicates = [False] * len(candidates)
+
+                for job, is_duplicate in zip(candidates, duplicates):
+                    if is_duplicate:
+                        self.logger.debug(f"Skipping duplicate job: {job.url}")
+                        continue
+                    jobs.append(job)
+
         except Exception as e:
             self.logger.error(f"Error extracting jobs from page: {e}", exc_info=True)
-        
+
         return jobs, found
-    
-    def _extract_job_from_element(self, elem) -> Optional[Job]:
+
+    def _extract_raw_jobs_from_html(self, html: str) -> List[dict]:
         """
-        Extract job information from a single job list element
-        
+        Extract raw job-card mappings from listing-page HTML
+
+        Mirrors _EXTRACT_JOBS_JS for listing pages fetched over plain
+        HTTP, so both paths feed the same _process_raw_jobs pipeline.
+
         Args:
-            elem: Playwright Locator for job element
-        
+            html: Listing page HTML as returned by the API endpoint
+
+        Returns:
+            List of raw field mappings, one per job card with a URL
+        """
+        raw_jobs = []
+        doc = lxml.html.fromstring(html)
+
+        for li in _X_LISTING_CARDS(doc):
+            links = _X_CARD_LINK(li)
+            href = links[0].get('href') if links else None
+            if not href:
+                continue
+
+            time_nodes = _X_CARD_TIME(li)
+
+            raw_jobs.append({
+                'title': _first_text(_X_CARD_TITLE(li)),
+                'company': _first_text(_X_CARD_COMPANY(li)),
+                'url': href.split('?')[0],
+                'location': _first_text(_X_CARD_LOCATION(li)),
+                'posted_date': time_nodes[0].get('datetime') if time_nodes else None,
+                'posted_text': _first_text(time_nodes),
+                'snippet': _first_text(_X_CARD_SNIPPET(li)),
+            })
+
+        return raw_jobs
+
+    def _fetch_listing_html(self, url: str) -> Optional[str]:
+        """
+        Fetch a listing page over plain HTTP
+
+        Args:
+            url: Listing page URL (API endpoint with start offset)
+
         Returns:
-            Job object or None if extraction fails
+            Page HTML, the _NEEDS_BROWSER sentinel when the anti-bot
+            interstitial was served, or None on failure
         """
         try:
-            # Extract job title (h3 element)
-            title_elem = elem.locator('h3')
-            title = title_elem.inner_text().strip() if title_elem.count() > 0 else "Unknown"
-            
-            # Extract company name (h4 element)
-            company_elem = elem.locator('h4')
-            company = company_elem.inner_text().strip() if company_elem.count() > 0 else "Unknown"
-            
-            # Extract job link (a element with specific tracking attribute)
-            link_elem = elem.locator("a[data-tracking-control-name='public_jobs_jserp-result_search-card']")
-            url = link_elem.get_attribute('href').split('?')[0]
-            
+            self._rate_limiter.acquire()
+            self.logger.debug(f"Fetching listing via HTTP: {url}")
+            response = self._http_session.get(url, timeout=self.timeout / 1000)
+
+            if response.ok and _INTERSTITIAL_MARKER not in response.text[:2000]:
+                return response.text
+
+            self.logger.debug(
+                f"HTTP listing fetch blocked for {url}, falling back to browser"
+            )
+            return _NEEDS_BROWSER
+
+        except requests.RequestException as e:
+            self.logger.warning(f"HTTP listing fetch failed for {url}: {e}")
+            return None
+
+    def _build_job_from_raw(self, raw: dict) -> Optional[Job]:
+        """
+        Build a Job from the raw field mapping returned by _EXTRACT_JOBS_JS
+
+        Args:
+            raw: Dictionary with title/company/url/location/posted fields
+
+        Returns:
+            Job object or None if the card lacks the basic fields
+        """
+        try:
+            title = raw.get('title') or _UNKNOWN
+            url = raw.get('url')
+
             # Skip if we couldn't get basic info
-            if title == "Unknown" or not url:
+            if title is _UNKNOWN or not url:
                 return None
-            
-            # Extract location (may be in various places, try common selectors)
-            location = "Not specified"
-            location_selectors = ['.job-search-card__location', 'span.job-search-card__location']
-            for selector in location_selectors:
-                location_elem = elem.locator(selector)
-                if location_elem.count() > 0:
-                    location = location_elem.inner_text().strip()
-                    break
-            
-            # Extract posted date if available
-            posted_date = None
-            time_elem = elem.locator('time')
-            if time_elem.count() > 0:
-                posted_date = time_elem.get_attribute('datetime')
-                posted_time = self._parse_time_ago_to_seconds(time_elem.inner_text().strip())
-                
-            # Create Job object
+
+            # Create Job object; the listing snippet seeds the description
+            # until the full detail text replaces it
             job = Job(
                 title=title,
-                company=company,
-                location=location,
+                company=raw.get('company') or _UNKNOWN,
+                location=raw.get('location') or _NOT_SPECIFIED,
                 url=url,
+                description=raw.get('snippet') or '',
                 source='linkedin',
-                posted_date=posted_date,
-                posted_time=posted_time
+                posted_date=raw.get('posted_date'),
+                posted_time=self._parse_time_ago_to_seconds(raw.get('posted_text') or '')
             )
-            
+
             return job
-            
+
         except Exception as e:
-            self.logger.warning(f"Failed to extract job from element: {e}")
+            self.logger.warning(f"Failed to build job from element data: {e}")
             return None
     
     @staticmethod
@@ -441,64 +933,114 @@ class LinkedInScraperService:
         """
         if not time_string:
             return None
-        
-        # Pattern to match: number followed by time unit
-        pattern = r'(\d+)\s+(minute|minutes|hour|hours|day|days)\s+ago'
-        match = re.search(pattern, time_string.lower())
-        
+
+        match = _TIME_AGO_RE.search(time_string)
         if not match:
             return None
-        
-        number = int(match.group(1))
-        unit = match.group(2)
-        
-        # Convert to seconds based on unit
-        if unit in ['minute', 'minutes']:
-            return number * 60
-        elif unit in ['hour', 'hours']:
-            return number * 3600
-        elif unit in ['day', 'days']:
-            return number * 86400
-        
-        return None
+
+        return int(match.group(1)) * _UNIT_SECS[match.group(2).lower()]
     
-    def fetch_job_details(self, job_url: str) -> Optional[dict]:
+    def _fetch_job_details_http(self, job_url: str) -> Optional[str]:
         """
-        Fetch detailed job description from job URL
-        
+        Fetch job description over plain HTTP
+
+        The LinkedIn guest job detail page is static HTML, so a pooled HTTP
+        GET is orders of magnitude cheaper than a browser navigation. Falls
+        back to the Playwright-based fetch when the anti-bot interstitial is
+        returned instead of the job page.
+
         Args:
             job_url: URL of the job posting
-        
+
         Returns:
-            Dictionary with job details or None if fetch fails
+            Job description text (lowercased), the _NEEDS_BROWSER sentinel
+            when the anti-bot interstitial was served, or None on failure
+        """
+        # Warm URLs are served straight from Redis - repeat sweeps hit the
+        # same postings within minutes
+        if self.redis_client:
+            cached = self.redis_client.get_cached_description(job_url)
+            if cached is not None:
+                self.logger.debug(f"Description cache hit for: {job_url}")
+                return cached
+
+        try:
+            self._rate_limiter.acquire()
+            self.logger.debug(f"Fetching job details via HTTP from: {job_url}")
+            # Stream and cap the body - the description is near the top of
+            # the document, so the page's long tail is never downloaded
+            with self._http_session.get(
+                job_url, stream=True, timeout=self.timeout / 1000
+            ) as response:
+                if not response.ok:
+                    body = b''
+                else:
+                    body = response.raw.read(_DETAIL_MAX_BYTES, decode_content=True)
+
+            head = body[:2000].decode('utf-8', errors='replace')
+            if body and _INTERSTITIAL_MARKER not in head:
+                # lxml recovers cleanly from the truncated markup
+                doc = lxml.html.fromstring(body)
+                content = _X_DETAIL_SECTION(doc) or _X_DETAIL_FALLBACK(doc)
+                if content:
+                    details = content[0].text_content().strip().lower()
+                    if self.redis_client:
+                        self.redis_client.cache_description(job_url, details)
+                    return details
+
+            self.logger.debug(
+                f"HTTP fetch blocked or empty for {job_url}, falling back to browser"
+            )
+            return _NEEDS_BROWSER
+
+        except requests.RequestException as e:
+            self.logger.warning(f"HTTP fetch failed for {job_url}: {e}")
+            return None
+
+    def fetch_job_details(self, job_url: str) -> Optional[str]:
+        """
+        Fetch job description with the browser
+
+        This is the fallback path for _fetch_job_details_http, used when
+        the anti-bot interstitial blocks the plain HTTP fetch.
+
+        Args:
+            job_url: URL of the job posting
+
+        Returns:
+            Job description text (lowercased) or None if fetch fails
         """
         
         page = None
         try:
-            page = self._create_stealth_page()
+            page = self._acquire_page()
             page.set_default_timeout(self.timeout)
-            
+
             # Random delay to appear more human-like
-            time.sleep(time.time() % 3)  # Random delay between 2-3.5 seconds
+            time.sleep(random.uniform(0.5, 1.5))
             self.logger.debug(f"Fetching job details from: {job_url}")
-            # Wait for network to be idle to ensure page is fully loaded
-            # Navigate to job URL with retry logic
+            # Navigate to job URL with retry logic. The anti-bot
+            # interstitial is sniffed from the navigation response body at
+            # 'commit' - no point waiting for a blocked page to finish
+            # loading before retrying.
             count = 3
             success = False
             while count > 0 and not success:
                 try:
-                    page.goto(job_url, wait_until='domcontentloaded')
-                    html = page.content()
-                    if """<html><head>\n    <meta http-equiv="refresh" content="1;url=https://www.linkedin.com">\n    <script type="text/javascript">""" not in html:
-                            success = True
+                    response = page.goto(job_url, wait_until='commit')
+                    body = response.text() if response else ''
+                    if _INTERSTITIAL_MARKER not in body[:2000]:
+                        # Real job page - now wait for the DOM we extract from
+                        page.wait_for_load_state('domcontentloaded')
+                        success = True
                     else:
-                        time.sleep(time.time() % 10)
+                        time.sleep(random.uniform(2.0, 5.0))
                 except PlaywrightTimeout:
                     self.logger.warning(f"Timeout loading page, retries left: {count - 1}")
-                    time.sleep(time.time() % 10)
+                    time.sleep(random.uniform(2.0, 5.0))
                 count -= 1
-                
-            
+
+
             if not success:
                 self.logger.error(f"Failed to load job details page after retries: {job_url}")
                 return None
@@ -518,7 +1060,12 @@ class LinkedInScraperService:
             if not job_details:
                 self.logger.warning(f"Could not extract job details from {job_url}")
                 return None
-           
+
+            # Populate the description cache for the next sweep (the HTTP
+            # path checked it before falling back here, so this is a miss)
+            if self.redis_client:
+                self.redis_client.cache_description(job_url, job_details)
+
             return job_details
 
         except Exception as e:
@@ -526,7 +1073,7 @@ class LinkedInScraperService:
             return None
         finally:
             if page:
-                page.close()
+                self._release_page(page)
 
     def _evaluate_job_details(self, job_details: str, keywords: List[str]) -> bool:
         """
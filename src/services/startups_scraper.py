@@ -1,8 +1,9 @@
 """Startups.gallery job scraper service using Playwright"""
 
+import atexit
 import logging
 import re
-import time
+import threading
 from datetime import datetime
 from typing import List, Optional, Tuple
 from playwright.sync_api import sync_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
@@ -10,6 +11,26 @@ from playwright.sync_api import sync_playwright, Browser, Page, TimeoutError as
 from src.models.job import Job
 from src.utils.redis_client import RedisClient
 
+# Resource types aborted by route interception - none are needed to
+# extract job text, and together they dominate bytes transferred.
+# Documents, scripts, and xhr/fetch pass through so the SPA still
+# renders the job data.
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# Extract every job row in a single evaluate call - one CDP round-trip
+# instead of ~6 locator calls per row (href, paragraph, heading lookups)
+_EXTRACT_ROWS_JS = """
+() => Array.from(document.querySelectorAll('div[data-framer-name="Main"] a')).map(a => {
+    const p = a.querySelector('p');
+    const h = a.querySelector('h1,h2,h3,h4,h5,h6');
+    return {
+        href: a.getAttribute('href'),
+        text: p ? p.innerText : '',
+        title: (h && h.innerText.trim()) || (a.innerText.split('\\n')[0] || '').trim()
+    };
+}).filter(r => r.href)
+"""
+
 
 class StartupsScraperService:
     """
@@ -20,7 +41,21 @@ class StartupsScraperService:
     """
     
     BASE_URL = "https://startups.gallery/jobs"
-    
+
+    # "Posted on Nov 4, 2025" / "November 4, 2025" - a regex plus month
+    # lookup is several times faster than strptime for this fixed format
+    _DATE_RE = re.compile(r'(?:Posted on\s+)?([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})')
+    _MONTHS = {
+        month: index for index, month in enumerate(
+            ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1
+        )
+    }
+
+    # Process-level shared instance (see get_shared)
+    _shared_instance: Optional["StartupsScraperService"] = None
+    _shared_lock = threading.Lock()
+
     def __init__(
         self, 
         headless: bool = True, 
@@ -43,6 +78,8 @@ class StartupsScraperService:
         self.timeout = timeout
         self.logger = logging.getLogger("job_scrapper.service.startups")
         self._browser: Optional[Browser] = None
+        self._context = None
+        self._page: Optional[Page] = None
         self._playwright = None
         
         # Initialize Redis client for caching
@@ -58,6 +95,30 @@ class StartupsScraperService:
             self.logger.error(f"Failed to initialize Redis client: {e}")
             self.redis_client = None
     
+    @classmethod
+    def get_shared(cls, **kwargs) -> "StartupsScraperService":
+        """
+        Get the process-level shared scraper, starting it on first use
+
+        Launching Chromium costs hundreds of milliseconds; callers that
+        search several keywords in one process should reuse this warm
+        instance instead of paying the launch per `with` block. The
+        browser is stopped automatically at interpreter exit.
+
+        Args:
+            **kwargs: Constructor arguments, honored only on first call
+
+        Returns:
+            The shared, already-started StartupsScraperService
+        """
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                instance = cls(**kwargs)
+                instance.start()
+                atexit.register(instance.stop)
+                cls._shared_instance = instance
+        return cls._shared_instance
+
     def __enter__(self):
         """Context manager entry - start browser"""
         self.start()
@@ -88,11 +149,35 @@ class StartupsScraperService:
                 '--disable-features=IsolateOrigins,site-per-process',
             ]
         )
-        
+
+        # One warm context + page reused across keyword searches - keeps
+        # the HTTP cache (JS/CSS bundles) hot instead of cold-starting a
+        # fresh context per search
+        self._context = self._browser.new_context()
+
+        # Abort image/media/font/stylesheet requests - pure bandwidth
+        # savings on an I/O-bound scrape
+        self._context.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+            else route.continue_()
+        )
+
+        self._page = self._context.new_page()
+
         self.logger.info("Browser started successfully")
-    
+
     def stop(self) -> None:
         """Stop the browser and cleanup"""
+        if self._page:
+            self._page.close()
+            self._page = None
+
+        if self._context:
+            self._context.close()
+            self._context = None
+
         if self._browser:
             self.logger.info("Closing browser...")
             self._browser.close()
@@ -114,36 +199,19 @@ class StartupsScraperService:
         Returns:
             datetime object or None if parsing fails
         """
-        try:
-            # Remove "Posted on " prefix
-            date_str = date_str.replace("Posted on ", "").strip()
-            
-            # Parse the date
-            # Format: "Nov 4, 2025" or "Nov 04, 2025"
-            date_obj = datetime.strptime(date_str, "%b %d, %Y")
-            return date_obj
-        except ValueError:
-            # Try alternative format if first fails
-            try:
-                date_obj = datetime.strptime(date_str, "%B %d, %Y")  # "November 4, 2025"
-                return date_obj
-            except ValueError:
-                self.logger.warning(f"Failed to parse date: {date_str}")
-                return None
-    
-    def _is_today(self, date_obj: datetime) -> bool:
-        """
-        Check if date is today
-        
-        Args:
-            date_obj: datetime object to check
-        
-        Returns:
-            True if date is today, False otherwise
-        """
-        today = datetime.now().date()
-        return date_obj.date() == today
-    
+        # Accepts abbreviated and full month names ("Nov"/"November")
+        match = self._DATE_RE.search(date_str)
+        if match:
+            month = self._MONTHS.get(match.group(1)[:3].title())
+            if month:
+                try:
+                    return datetime(int(match.group(3)), month, int(match.group(2)))
+                except ValueError:
+                    pass
+
+        self.logger.warning(f"Failed to parse date: {date_str}")
+        return None
+
     def search_jobs(
         self,
         keywords: str,
@@ -159,10 +227,10 @@ class StartupsScraperService:
         Returns:
             List of Job objects
         """
-        if not self._browser:
+        if not self._page:
             self.logger.error("Browser not started. Call start() first.")
             return []
-        
+
         if not keywords:
             self.logger.warning("No keywords provided for search")
             return []
@@ -170,11 +238,14 @@ class StartupsScraperService:
         self.logger.info(f"Searching startups.gallery for: '{keywords}'")
         
         try:
-            page = self._browser.new_page()
-            
-            # Navigate to jobs page
+            # Reuse the warm page; navigating resets the results list
+            page = self._page
+
+            # Navigate to jobs page - domcontentloaded plus an explicit
+            # selector wait is faster and more reliable than networkidle,
+            # which pads every navigation with idle time
             self.logger.debug(f"Navigating to {self.BASE_URL}")
-            page.goto(self.BASE_URL, wait_until="networkidle", timeout=self.timeout)
+            page.goto(self.BASE_URL, wait_until="domcontentloaded", timeout=self.timeout)
             
             # Wait for search input to be visible
             self.logger.debug("Waiting for search input...")
@@ -193,9 +264,13 @@ class StartupsScraperService:
             # Submit search by pressing Enter
             search_input.press("Enter")
             
-            # Wait for results to load
-            time.sleep(2)
-            page.wait_for_load_state("networkidle", timeout=self.timeout)
+            # Wait for actual result rows instead of sleeping + networkidle
+            try:
+                page.wait_for_selector(
+                    'div[data-framer-name="Main"] a p', timeout=self.timeout
+                )
+            except PlaywrightTimeout:
+                self.logger.debug("No job rows appeared after search")
             
             all_jobs = []
             today = datetime.now().date()
@@ -206,90 +281,63 @@ class StartupsScraperService:
             data_framer = page.locator('div[data-framer-name="Main"]')
             
             while len(all_jobs) < max_results and load_more_attempts < max_load_more_attempts:
-                # Get all job links
-                job_links = data_framer.locator("a")
-                job_count = job_links.count()
-                
+                # Pull every row in one evaluate call instead of per-row
+                # locator round-trips
+                rows = page.evaluate(_EXTRACT_ROWS_JS)
+                job_count = len(rows)
+
                 self.logger.debug(f"Found {job_count} job links on current page")
-                
+
                 if job_count == 0:
                     self.logger.debug("No more jobs found")
                     break
-                
+
                 # Extract jobs from current batch
                 jobs_in_batch = []
                 found_old_job = False
-                
-                for i in range(job_count):
+
+                for i, row in enumerate(rows):
                     try:
-                        row = job_links.nth(i)
-                        
-                        # Get job URL
-                        job_url = row.get_attribute("href")
-                        if not job_url:
-                            continue
-                        
+                        job_url = row["href"]
+
                         # Make URL absolute if relative
                         if job_url.startswith("/"):
                             job_url = f"https://startups.gallery{job_url}"
                         elif not job_url.startswith("http"):
                             job_url = f"https://startups.gallery/{job_url}"
-                        
-                        # Get text content from paragraph element
-                        element = row.locator("p")
-                        if element.count() == 0:
+
+                        text_content = row["text"]
+                        if not text_content:
                             continue
-                        
-                        text_content = element.inner_text()
-                        
+
                         # Split by "·" to get company, location, date
                         parts = text_content.split("·")
-                        
+
                         if len(parts) >= 3:
                             company = parts[0].strip()
                             location = parts[1].strip()
                             date_posted_str = parts[2].strip()
-                            
+
                             # Parse date
                             posted_date_obj = self._parse_date(date_posted_str)
-                            
+
                             if posted_date_obj is None:
                                 self.logger.warning(f"Could not parse date: {date_posted_str}")
                                 continue
-                            
+
                             # Check if date is today - if not, stop processing
-                            if not self._is_today(posted_date_obj):
+                            if posted_date_obj.date() != today:
                                 self.logger.debug(
                                     f"Found job from {posted_date_obj.date()}, "
                                     f"not today ({today}). Stopping search."
                                 )
                                 found_old_job = True
                                 break
-                            
-                            # Extract job title
-                            # Try to get from heading elements first
-                            title = None
-                            title_selectors = ["h1", "h2", "h3", "h4", "h5", "h6"]
-                            for selector in title_selectors:
-                                title_elem = row.locator(selector)
-                                if title_elem.count() > 0:
-                                    title = title_elem.first.inner_text().strip()
-                                    if title:
-                                        break
-                            
-                            # If no title found, try link text
-                            if not title:
-                                link_text = row.inner_text().strip()
-                                if link_text:
-                                    # Try to extract title from link text (before company info)
-                                    lines = link_text.split("\n")
-                                    if lines:
-                                        title = lines[0].strip()
-                            
-                            # Fallback to company name if still no title
-                            if not title:
-                                title = company
-                            
+
+                            # Title from heading/link text (extracted in JS),
+                            # falling back to the company name
+                            title = row["title"] or company
+
                             # Create Job object
                             job = Job(
                                 title=title,
@@ -302,17 +350,31 @@ class StartupsScraperService:
                                 posted_time=None,
                                 scraped_at=datetime.now()
                             )
-                            
-                            # Check Redis cache for duplicates
-                            if self.redis_client and self.redis_client.check_and_cache_job(job):
-                                self.logger.debug(f"Skipping duplicate job: {job.url}")
-                                continue
-                            
+
                             jobs_in_batch.append(job)
-                                
+
                     except Exception as e:
                         self.logger.warning(f"Error extracting job {i}: {e}")
                         continue
+
+                # Batch the Redis duplicate checks: one URL-set round-trip
+                # (rows repeat across "Load more" batches) plus the pipelined
+                # description-hash check, instead of 2 round-trips per job
+                if self.redis_client and jobs_in_batch:
+                    seen = self.redis_client.check_and_cache_urls(
+                        [job.url for job in jobs_in_batch]
+                    )
+                    jobs_in_batch = [
+                        job for job, is_seen in zip(jobs_in_batch, seen) if not is_seen
+                    ]
+                    if jobs_in_batch:
+                        duplicates = self.redis_client.check_and_cache_jobs_batch(
+                            jobs_in_batch
+                        )
+                        jobs_in_batch = [
+                            job for job, is_dup in zip(jobs_in_batch, duplicates)
+                            if not is_dup
+                        ]
                 
                 # Add jobs from this batch (only jobs from today)
                 all_jobs.extend(jobs_in_batch)
@@ -334,10 +396,19 @@ class StartupsScraperService:
                         self.logger.debug("Clicking 'Load more' button...")
                         load_more_button.click()
                         load_more_attempts += 1
-                        
-                        # Wait for new jobs to load
-                        time.sleep(2)
-                        page.wait_for_load_state("networkidle", timeout=self.timeout)
+
+                        # Wait until the link count actually grows rather
+                        # than sleeping and waiting for network idle
+                        try:
+                            page.wait_for_function(
+                                "(prev) => document.querySelectorAll("
+                                "'div[data-framer-name=\"Main\"] a').length > prev",
+                                arg=job_count,
+                                timeout=self.timeout
+                            )
+                        except PlaywrightTimeout:
+                            self.logger.debug("No new jobs loaded after 'Load more'")
+                            break
                     else:
                         self.logger.debug("No 'Load more' button found, stopping")
                         break
@@ -345,8 +416,6 @@ class StartupsScraperService:
                     self.logger.warning(f"Error clicking load more button: {e}")
                     break
             
-            page.close()
-            
             # Trim to max_results
             all_jobs = all_jobs[:max_results]
             
@@ -367,12 +436,14 @@ class StartupsScraperService:
         Returns:
             Job description text or None if fetch fails
         """
-        if not self._browser:
+        if not self._context:
             self.logger.error("Browser not started. Call start() first.")
             return None
-        
+
         try:
-            page = self._browser.new_page()
+            # Detail pages get their own short-lived page so the listing
+            # page isn't clobbered, but share the warm context's cache
+            page = self._context.new_page()
             page.goto(job_url, wait_until="networkidle", timeout=self.timeout)
             
             # Try to extract job description
@@ -1,12 +1,35 @@
 """CSV writer utility with file locking for thread-safe operations"""
 
-import os
+import csv
+import hashlib
 import logging
-import pandas as pd
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 from filelock import FileLock, Timeout
 
+# Resolved output paths by filename - workers write the same file every
+# cycle, so resolve() and the mkdir probe only need to run once each
+_PATH_CACHE: Dict[str, Path] = {}
+_PATH_CACHE_LOCK = threading.Lock()
+
+
+def _url_key(url: str) -> int:
+    """
+    Collapse a URL to a 64-bit int for set-membership dedupe
+
+    Job URLs run 80-200 characters; keeping a digest instead of the
+    string shrinks the in-memory seen-set roughly tenfold on large
+    files, and int hashing/comparison is cheaper than string compare.
+
+    Args:
+        url: The job URL
+
+    Returns:
+        64-bit integer digest of the URL
+    """
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+
 
 def safe_write_csv(
     filename: str,
@@ -17,82 +40,123 @@ def safe_write_csv(
 ) -> bool:
     """
     Safely write data to CSV file with file locking to prevent race conditions
-    
+
     This function handles:
     - Creating output directory if it doesn't exist
-    - Loading existing data if file exists
-    - Merging new data with existing data
-    - Removing duplicates based on 'url' column
+    - Filtering out rows whose 'url' already exists in the file
+    - Appending only the new rows (the existing file is never rewritten)
     - File locking to prevent concurrent write conflicts
-    
+
+    Uses the stdlib csv module rather than pandas - a row append doesn't
+    justify importing pandas into every scraper process.
+
     Args:
         filename: Path to CSV file (can be relative or absolute)
         data: List of dictionaries to write (each dict represents a row)
         logger: Optional logger instance for logging operations
-        drop_columns: Optional list of column names to drop from DataFrame
+        drop_columns: Optional list of column names to drop from each row
         lock_timeout: Maximum seconds to wait for file lock (default: 30)
-    
+
     Returns:
         True if write was successful, False otherwise
     """
     if logger is None:
         logger = logging.getLogger("job_scrapper.utils.csv_writer")
-    
+
     if not data:
         logger.debug("No data to write to CSV")
         return True
-    
+
     try:
-        # Convert to absolute path
-        file_path = Path(filename).resolve()
-        
-        # Create output directory if it doesn't exist
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
+        # Resolve the path and create the output directory on first use
+        # only; repeat writes reuse the cached Path
+        file_path = _PATH_CACHE.get(filename)
+        if file_path is None:
+            file_path = Path(filename).resolve()
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with _PATH_CACHE_LOCK:
+                _PATH_CACHE[filename] = file_path
+
         # Create lock file path (same as CSV file but with .lock extension)
         lock_file = str(file_path) + ".lock"
-        
-        # Convert data to DataFrame
-        new_df = pd.DataFrame(data)
-        
-        # Drop specified columns if provided
-        if drop_columns:
-            new_df = new_df.drop(columns=drop_columns, errors='ignore')
-        
-        # Acquire file lock before reading/writing
-        with FileLock(lock_file, timeout=lock_timeout):
-            # Check if CSV file already exists
-            if file_path.exists():
+
+        dropped = set(drop_columns) if drop_columns else set()
+
+        # Acquire file lock before reading/writing; poll at 5ms instead
+        # of the 50ms default so a contended writer doesn't idle for up
+        # to a full poll period after the lock is released
+        with FileLock(lock_file, timeout=lock_timeout).acquire(poll_interval=0.005):
+            # Read the existing header and url column for dedupe - no need
+            # to load (and later rewrite) the whole file just to append
+            file_exists = file_path.exists() and file_path.stat().st_size > 0
+            fieldnames: Optional[List[str]] = None
+            seen_urls = set()
+            if file_exists:
                 try:
-                    # Load existing data
-                    existing_df = pd.read_csv(file_path)
-                    logger.debug(f"Loading existing data from {file_path} ({len(existing_df)} existing rows)")
-                    
-                    # Append new data to existing DataFrame
-                    combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                    
-                    # Remove duplicates based on URL (keeps first occurrence)
-                    if 'url' in combined_df.columns:
-                        original_count = len(combined_df)
-                        combined_df = combined_df.drop_duplicates(subset=['url'], keep='first')
-                        duplicates_removed = original_count - len(combined_df)
-                        if duplicates_removed > 0:
-                            logger.debug(f"Removed {duplicates_removed} duplicate row(s)")
-                    
-                    logger.debug(f"Combined data: {len(combined_df)} total rows")
+                    with file_path.open('r', newline='', encoding='utf-8') as f:
+                        reader = csv.reader(f)
+                        header = next(reader, None)
+                        if header:
+                            fieldnames = header
+                            if 'url' in header:
+                                url_index = header.index('url')
+                                seen_urls = {
+                                    _url_key(row[url_index]) for row in reader
+                                    if len(row) > url_index
+                                }
+                    logger.debug(f"Loaded {len(seen_urls)} existing urls from {file_path}")
                 except Exception as e:
                     logger.warning(f"Error reading existing CSV file: {e}. Creating new file.")
-                    combined_df = new_df
+                    file_exists = False
+                    fieldnames = None
+                    seen_urls = set()
             else:
-                combined_df = new_df
                 logger.debug(f"Creating new CSV file: {file_path}")
-            
-            # Write to CSV (still within lock context)
-            combined_df.to_csv(file_path, index=False, encoding='utf-8')
-            logger.debug(f"Successfully wrote {len(combined_df)} rows to {file_path}")
-            
+
+            # Filter out already-written urls (and dupes within the batch),
+            # drop requested columns, and blank out None values the way a
+            # DataFrame write would
+            rows = []
+            for row in data:
+                row = {
+                    key: ('' if value is None else value)
+                    for key, value in row.items() if key not in dropped
+                }
+                url = row.get('url')
+                if url is not None:
+                    key = _url_key(url)
+                    if key in seen_urls:
+                        continue
+                    seen_urls.add(key)
+                rows.append(row)
+
+            duplicates_removed = len(data) - len(rows)
+            if duplicates_removed > 0:
+                logger.debug(f"Removed {duplicates_removed} duplicate row(s)")
+
+            if not rows:
+                logger.debug("All rows already present, nothing to write")
+                return True
+
+            # Column order: existing header if appending, otherwise the
+            # union of row keys in first-seen order
+            if fieldnames is None:
+                fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+
+            # Append only the new rows (still within lock context); the
+            # header is written only when starting a fresh file
+            mode = 'a' if file_exists else 'w'
+            with file_path.open(mode, newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(
+                    f, fieldnames=fieldnames, restval='', extrasaction='ignore'
+                )
+                if not file_exists:
+                    writer.writeheader()
+                writer.writerows(rows)
+            logger.debug(f"Successfully appended {len(rows)} rows to {file_path}")
+
             return True
-            
+
     except Timeout:
         logger.error(
             f"Timeout waiting for file lock on {filename} "
@@ -101,35 +165,7 @@ def safe_write_csv(
         return False
     except Exception as e:
         logger.error(f"Failed to write CSV file {filename}: {e}", exc_info=True)
+        # Re-resolve next time in case the output directory went away
+        with _PATH_CACHE_LOCK:
+            _PATH_CACHE.pop(filename, None)
         return False
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
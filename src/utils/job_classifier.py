@@ -1,9 +1,9 @@
 """Job classification utility for categorizing and tagging jobs"""
 
-import re
 import logging
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
+import ahocorasick
 
 
 # Job Categories
@@ -165,6 +165,170 @@ TAGS = {
 }
 
 
+logger = logging.getLogger("job_scrapper.utils.job_classifier")
+
+# 256-entry word-character table for boundary checks on automaton hits
+_IS_WORDCHAR = bytes(
+    1 if chr(i).isalnum() or chr(i) == "_" else 0 for i in range(256)
+)
+
+# '.', '+', and '#' join tokens ('asp.net', 'c++', 'c#') but also end
+# sentences ('experience with Docker.'); they only block a match when a
+# word character sits on their far side
+_CONNECTOR_CHARS = frozenset(".+#")
+
+
+def _is_word_char(char: str) -> bool:
+    """
+    Check whether a character continues a word for boundary filtering
+
+    Args:
+        char: Single character adjacent to a keyword match
+
+    Returns:
+        True if the character is part of a word (match is embedded)
+    """
+    code = ord(char)
+    return bool(_IS_WORDCHAR[code]) if code < 256 else char.isalnum()
+
+
+def _continues_token(text: str, index: int, step: int) -> bool:
+    """
+    Check whether the character at index extends a token past a match
+
+    Word characters always do. Connector characters ('.', '+', '#')
+    only do when the character beyond them, in the given direction, is
+    itself a word character - so the '.' in 'asp.net' blocks an inner
+    'net' hit, while a sentence-ending '.' after 'docker' does not.
+
+    Args:
+        text: The scanned text
+        index: Index of the character adjacent to the match
+        step: Direction to look beyond a connector (+1 after, -1 before)
+
+    Returns:
+        True if the character ties the match into a longer token
+    """
+    char = text[index]
+    if _is_word_char(char):
+        return True
+    if char in _CONNECTOR_CHARS:
+        beyond = index + step
+        return 0 <= beyond < len(text) and _is_word_char(text[beyond])
+    return False
+
+
+def _on_word_boundary(text: str, end_index: int, length: int) -> bool:
+    """
+    Check that a match at end_index with the given length stands alone
+
+    Rejects hits embedded in longer tokens - short keywords like 'go',
+    'ts', or 'api' otherwise fire inside 'django', 'typescript', and
+    'rapid'.
+
+    Args:
+        text: The scanned text
+        end_index: Index of the match's last character
+        length: Length of the matched keyword
+
+    Returns:
+        True if both neighbors are word boundaries
+    """
+    start = end_index - length + 1
+    if start > 0 and _continues_token(text, start - 1, -1):
+        return False
+    next_index = end_index + 1
+    if next_index < len(text) and _continues_token(text, next_index, 1):
+        return False
+    return True
+
+
+def _compile_keyword_index() -> Dict[str, Tuple[str, ...]]:
+    """
+    Collapse TAGS into one entry per distinct keyword string
+
+    Some keywords legitimately belong to several tags ("rails" is Ruby
+    and Rails, ".net" is C# and .NET); the index stores each string once
+    with the tuple of tag names it maps to, so the automatons hold one
+    state chain per string and emit all tags in a single callback.
+    Multi-mapped keywords are logged at debug level to keep the
+    vocabulary auditable.
+
+    Returns:
+        Mapping of lowercase keyword to the tuple of tag names it triggers
+    """
+    index: Dict[str, List[str]] = {}
+    for tag_group, tags in TAGS.items():
+        for tag_name, keywords in tags.items():
+            for keyword in keywords:
+                index.setdefault(keyword.lower(), []).append(tag_name)
+
+    for keyword, tag_names in index.items():
+        if len(tag_names) > 1:
+            logger.debug("Tag keyword %r maps to multiple tags: %s", keyword, tag_names)
+
+    return {keyword: tuple(tag_names) for keyword, tag_names in index.items()}
+
+
+_KEYWORD_INDEX = _compile_keyword_index()
+
+
+def _build_tags_automaton() -> "ahocorasick.Automaton":
+    """
+    Build the tag-matching automaton from the compiled keyword index
+
+    Returns:
+        Finalized ahocorasick.Automaton over all tag keywords
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword, tag_names in _KEYWORD_INDEX.items():
+        automaton.add_word(keyword, (len(keyword), tag_names))
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import - the vocabulary is fixed, so every job shares
+# a single automaton and tag extraction is one C-level scan
+_TAGS_AUTOMATON = _build_tags_automaton()
+
+
+def _build_classify_automaton() -> "ahocorasick.Automaton":
+    """
+    Build the fused category + tag automaton for classify_job
+
+    Each distinct keyword string carries a tuple of entries
+    (kind, key, entry_id) where kind is 'title'/'desc' for category
+    keywords (key = category name) or 'tag' (key = tag name). The
+    entry_id lets classify_job count each category keyword at most
+    once, matching the old per-keyword presence counting.
+
+    Returns:
+        Finalized ahocorasick.Automaton over all classifier keywords
+    """
+    keyword_entries: Dict[str, List[Tuple[str, str, int]]] = {}
+    entry_id = 0
+    for category, keywords in CATEGORIES.items():
+        for kind, field_name in (('title', 'title_keywords'), ('desc', 'description_keywords')):
+            for keyword in keywords[field_name]:
+                keyword_entries.setdefault(keyword.lower(), []).append(
+                    (kind, category, entry_id)
+                )
+                entry_id += 1
+    for keyword, tag_names in _KEYWORD_INDEX.items():
+        for tag_name in tag_names:
+            keyword_entries.setdefault(keyword, []).append(('tag', tag_name, entry_id))
+            entry_id += 1
+
+    automaton = ahocorasick.Automaton()
+    for keyword, entries in keyword_entries.items():
+        automaton.add_word(keyword, (len(keyword), tuple(entries)))
+    automaton.make_automaton()
+    return automaton
+
+
+_CLASSIFY_AUTOMATON = _build_classify_automaton()
+
+
 @dataclass
 class ClassificationResult:
     """Result of job classification"""
@@ -178,28 +342,6 @@ def _normalize_text(text: str) -> str:
     return text.lower().strip()
 
 
-def _match_keywords(text: str, keywords: List[str]) -> int:
-    """
-    Count keyword matches in text
-    
-    Args:
-        text: Text to search in (should be lowercase)
-        keywords: List of keywords to match
-    
-    Returns:
-        Number of keyword matches found
-    """
-    matches = 0
-    for keyword in keywords:
-        # Check if keyword is a regex pattern
-        if keyword.startswith(r"\b"):
-            if re.search(keyword, text, re.IGNORECASE):
-                matches += 1
-        elif keyword.lower() in text:
-            matches += 1
-    return matches
-
-
 def classify_job(title: str, description: str) -> ClassificationResult:
     """
     Classify a job based on title and description
@@ -213,19 +355,30 @@ def classify_job(title: str, description: str) -> ClassificationResult:
     """
     title_lower = _normalize_text(title)
     description_lower = _normalize_text(description)
-    combined_text = f"{title_lower} {description_lower}"
-    
-    # Determine category
-    category_scores: Dict[str, float] = {}
-    
-    for category, keywords in CATEGORIES.items():
-        title_matches = _match_keywords(title_lower, keywords["title_keywords"])
-        desc_matches = _match_keywords(description_lower, keywords["description_keywords"])
-        
-        # Title matches are weighted more heavily (3x)
-        score = (title_matches * 3) + desc_matches
-        category_scores[category] = score
-    
+
+    # One fused scan scores categories and collects tags together. The
+    # null separator keeps keywords from matching across the boundary,
+    # and the match position tells us which field it landed in.
+    combined_text = f"{title_lower}\x00{description_lower}"
+    title_length = len(title_lower)
+
+    category_scores: Dict[str, float] = dict.fromkeys(CATEGORIES, 0)
+    matched_tags = set()
+    counted = set()
+
+    for end_index, (length, entries) in _CLASSIFY_AUTOMATON.iter(combined_text):
+        if not _on_word_boundary(combined_text, end_index, length):
+            continue
+        in_title = end_index < title_length
+        for kind, key, entry_id in entries:
+            if kind == 'tag':
+                matched_tags.add(key)
+            elif (kind == 'title') == in_title and entry_id not in counted:
+                # Title matches are weighted more heavily (3x); each
+                # keyword counts once per field, as before
+                counted.add(entry_id)
+                category_scores[key] += 3 if in_title else 1
+
     # Get the category with highest score
     best_category = max(category_scores, key=category_scores.get)
     best_score = category_scores[best_category]
@@ -237,13 +390,10 @@ def classify_job(title: str, description: str) -> ClassificationResult:
     else:
         # Normalize confidence (cap at 1.0)
         confidence = min(best_score / 10.0, 1.0)
-    
-    # Extract tags
-    tags = extract_tags(title, description)
-    
+
     return ClassificationResult(
         category=best_category,
-        tags=tags,
+        tags=sorted(matched_tags),
         confidence=confidence
     )
 
@@ -260,22 +410,14 @@ def extract_tags(title: str, description: str) -> List[str]:
         List of matched tags
     """
     combined_text = _normalize_text(f"{title} {description}")
-    matched_tags = []
-    
-    for tag_group, tags in TAGS.items():
-        for tag_name, keywords in tags.items():
-            for keyword in keywords:
-                # Check if keyword is a regex pattern
-                if keyword.startswith(r"\b"):
-                    if re.search(keyword, combined_text, re.IGNORECASE):
-                        if tag_name not in matched_tags:
-                            matched_tags.append(tag_name)
-                        break
-                elif keyword.lower() in combined_text:
-                    if tag_name not in matched_tags:
-                        matched_tags.append(tag_name)
-                    break
-    
+
+    # Single automaton scan instead of a substring test per keyword;
+    # boundary filtering drops hits embedded in longer tokens
+    matched_tags = set()
+    for end_index, (length, tag_names) in _TAGS_AUTOMATON.iter(combined_text):
+        if _on_word_boundary(combined_text, end_index, length):
+            matched_tags.update(tag_names)
+
     return sorted(matched_tags)
 
 
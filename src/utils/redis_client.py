@@ -3,12 +3,88 @@
 import os
 import logging
 import hashlib
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import redis
 
 from src.models.job import Job
 
+# Process-wide connection pools keyed by (host, port, db) so every
+# RedisClient in the process shares warm connections instead of
+# opening and closing its own
+_POOL_CACHE: dict = {}
+_POOL_LOCK = threading.Lock()
+
+# Prefilled hasher prototype - copy() skips the constructor's parameter
+# block setup that hashlib.blake2b(digest_size=...) redoes on every call
+_DESCRIPTION_HASHER = hashlib.blake2b(digest_size=16)
+
+# 256-entry A-Z -> a-z table; translating the encoded bytes lowercases
+# ASCII-heavy descriptions in one C pass without the intermediate
+# Unicode string that str.lower() allocates
+_ASCII_LOWER = bytes.maketrans(
+    bytes(range(ord('A'), ord('Z') + 1)),
+    bytes(range(ord('a'), ord('z') + 1)),
+)
+
+# Atomic check-and-cache: HEXISTS + HSET + EXPIRE collapse into one
+# server-side call instead of three sequential round-trips
+_CHECK_AND_CACHE_LUA = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 1 then
+    return 1
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 0
+"""
+
+# Server-side stats aggregation: cursor-driven SCAN (not KEYS, which
+# would block on large keyspaces) plus HLEN per company hashset, all in
+# one call instead of one round-trip per SCAN batch and per HLEN
+_CACHE_STATS_LUA = """
+local cursor = '0'
+local companies = 0
+local total = 0
+repeat
+    local result = redis.call('SCAN', cursor, 'MATCH', 'job:company:*', 'COUNT', 500)
+    cursor = result[1]
+    for _, key in ipairs(result[2]) do
+        companies = companies + 1
+        total = total + redis.call('HLEN', key)
+    end
+until cursor == '0'
+return {companies, total}
+"""
+
+
+def _get_connection_pool(host: str, port: int, db: int) -> redis.ConnectionPool:
+    """
+    Get (or create) the shared connection pool for a Redis endpoint
+
+    Args:
+        host: Redis server host
+        port: Redis server port
+        db: Redis database number
+
+    Returns:
+        Shared redis.ConnectionPool for the endpoint
+    """
+    key = (host, port, db)
+    with _POOL_LOCK:
+        pool = _POOL_CACHE.get(key)
+        if pool is None:
+            pool = redis.ConnectionPool(
+                host=host,
+                port=port,
+                db=db,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5
+            )
+            _POOL_CACHE[key] = pool
+    return pool
+
 
 class RedisClient:
     """
@@ -29,7 +105,15 @@ class RedisClient:
             "d4e5f6...": "2024-10-19T11:45:00"
         }
     """
-    
+
+    # Set of job URLs already seen; cheap first-pass dedupe that runs
+    # before the description is fetched
+    URL_SET_KEY = "job:urls:seen"
+
+    # Descriptions are cached under a shorter TTL than the dedupe data
+    # so edited postings don't serve stale text for long
+    DESCRIPTION_TTL = 3600
+
     def __init__(
         self, 
         host: Optional[str] = None,
@@ -57,19 +141,20 @@ class RedisClient:
         self.logger.info(f"Initializing Redis client: {self.host}:{self.port}/{self.db}")
         
         try:
-            # Create Redis connection
+            # Create Redis connection over the shared per-endpoint pool
             self.client = redis.Redis(
-                host=self.host,
-                port=self.port,
-                db=self.db,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5
+                connection_pool=_get_connection_pool(self.host, self.port, self.db)
             )
-            
+
             # Test connection
             self.client.ping()
             self.logger.info("Redis connection established successfully")
+
+            # Registered once; run as EVALSHA after the first call
+            self._check_and_cache_script = self.client.register_script(
+                _CHECK_AND_CACHE_LUA
+            )
+            self._cache_stats_script = self.client.register_script(_CACHE_STATS_LUA)
             
         except redis.ConnectionError as e:
             self.logger.error(f"Failed to connect to Redis: {e}")
@@ -166,13 +251,252 @@ class RedisClient:
         Returns:
             True if job was already cached (duplicate), False if it's new
         """
+        try:
+            # One scripted round-trip instead of HEXISTS + HSET + EXPIRE
+            result = self._check_and_cache_script(
+                keys=[self._get_company_key(job.company)],
+                args=[
+                    self._hash_description(job.description),
+                    datetime.now().isoformat(),
+                    ttl or self.default_ttl,
+                ],
+            )
+            return bool(int(result))
+        except Exception as e:
+            # Server without scripting (or script error) - fall back to
+            # the separate check/cache calls
+            self.logger.debug(f"Scripted check-and-cache failed ({e}), falling back")
+
         if self.is_job_cached(job):
             return True  # Job is a duplicate
-        
+
         # Not cached, so cache it now
         self.cache_job(job, ttl)
         return False  # Job is new
-    
+
+    def check_and_cache_jobs_batch(self, jobs: List[Job], ttl: Optional[int] = None) -> List[bool]:
+        """
+        Check and cache a batch of jobs in two pipelined round-trips
+
+        Pipelines the per-job HEXISTS checks into one round-trip, then
+        caches all new jobs in a second one - instead of 2 round-trips
+        per job like calling check_and_cache_job in a loop.
+
+        Args:
+            jobs: The Job objects to check and cache
+            ttl: Time-to-live in seconds (defaults to default_ttl, 24 hours)
+
+        Returns:
+            List of booleans parallel to jobs: True if the job was already
+            cached (duplicate), False if it's new
+        """
+        if not jobs:
+            return []
+
+        try:
+            keys = [
+                (self._get_company_key(job.company), self._hash_description(job.description))
+                for job in jobs
+            ]
+
+            # Round-trip 1: existence checks for the whole batch
+            pipe = self.client.pipeline(transaction=False)
+            for company_key, description_hash in keys:
+                pipe.hexists(company_key, description_hash)
+            existing = pipe.execute()
+
+            # Round-trip 2: cache only the new jobs. Jobs sharing a
+            # company and description hash within the batch count as
+            # duplicates after the first, like the per-job loop did
+            timestamp = datetime.now().isoformat()
+            expiration = ttl or self.default_ttl
+            duplicates: List[bool] = []
+            emitted = set()
+            pipe = self.client.pipeline(transaction=False)
+            for pair, is_cached in zip(keys, existing):
+                if is_cached or pair in emitted:
+                    duplicates.append(True)
+                    continue
+                emitted.add(pair)
+                company_key, description_hash = pair
+                pipe.hset(company_key, description_hash, timestamp)
+                pipe.expire(company_key, expiration)
+                duplicates.append(False)
+            pipe.execute()
+            self.logger.debug(
+                f"Batch check of {len(jobs)} jobs: {sum(duplicates)} duplicates"
+            )
+            return duplicates
+
+        except Exception as e:
+            self.logger.error(f"Error batch-checking {len(jobs)} jobs: {e}")
+            # On error, assume none are cached to avoid missing jobs
+            return [False] * len(jobs)
+
+
+    def filter_new_jobs(self, jobs: List[Job], ttl: Optional[int] = None) -> List[Job]:
+        """
+        Return only the jobs not seen before, caching the new ones
+
+        Groups the batch by company so each company's description hashes
+        are checked with a single HMGET, then caches all misses with one
+        pipelined HSET mapping + EXPIRE per company - two round-trips
+        total regardless of batch size. Jobs sharing a description hash
+        within the batch count as duplicates after the first, matching
+        the per-job loop this replaces.
+
+        Args:
+            jobs: The Job objects to check and cache
+            ttl: Time-to-live in seconds (defaults to default_ttl, 24 hours)
+
+        Returns:
+            The new jobs, in their original order
+        """
+        if not jobs:
+            return []
+
+        try:
+            groups: Dict[str, List[Tuple[int, str]]] = {}
+            for index, job in enumerate(jobs):
+                company_key = self._get_company_key(job.company)
+                groups.setdefault(company_key, []).append(
+                    (index, self._hash_description(job.description))
+                )
+
+            # Round-trip 1: one HMGET per company
+            pipe = self.client.pipeline(transaction=False)
+            grouped = list(groups.items())
+            for company_key, items in grouped:
+                pipe.hmget(company_key, [description_hash for _, description_hash in items])
+            results = pipe.execute()
+
+            # Round-trip 2: cache the misses
+            timestamp = datetime.now().isoformat()
+            expiration = ttl or self.default_ttl
+            new_indices: List[int] = []
+            pipe = self.client.pipeline(transaction=False)
+            for (company_key, items), values in zip(grouped, results):
+                mapping: Dict[str, str] = {}
+                for (index, description_hash), value in zip(items, values):
+                    if value is None and description_hash not in mapping:
+                        mapping[description_hash] = timestamp
+                        new_indices.append(index)
+                if mapping:
+                    pipe.hset(company_key, mapping=mapping)
+                    pipe.expire(company_key, expiration)
+            pipe.execute()
+
+            new_indices.sort()
+            self.logger.debug(
+                f"Filtered {len(jobs)} jobs across {len(grouped)} companies: "
+                f"{len(new_indices)} new"
+            )
+            return [jobs[index] for index in new_indices]
+
+        except Exception as e:
+            self.logger.error(f"Error filtering {len(jobs)} jobs: {e}")
+            # On error, assume all are new to avoid missing jobs
+            return list(jobs)
+
+    def check_and_cache_urls(self, urls: List[str], ttl: Optional[int] = None) -> List[bool]:
+        """
+        Check and record job URLs in a shared Redis set
+
+        URL-level dedupe runs before the expensive detail fetch, when the
+        description (and therefore its hash) isn't available yet. One
+        SMISMEMBER round-trip checks the whole batch; new URLs are added
+        with a pipelined SADD + EXPIRE.
+
+        Args:
+            urls: The job URLs to check and record
+            ttl: Time-to-live in seconds (defaults to default_ttl, 24 hours)
+
+        Returns:
+            List of booleans parallel to urls: True if the URL was already
+            seen (duplicate), False if it's new
+        """
+        if not urls:
+            return []
+
+        try:
+            seen = self.client.smismember(self.URL_SET_KEY, urls)
+
+            new_urls = [url for url, is_seen in zip(urls, seen) if not is_seen]
+            if new_urls:
+                pipe = self.client.pipeline(transaction=False)
+                pipe.sadd(self.URL_SET_KEY, *new_urls)
+                pipe.expire(self.URL_SET_KEY, ttl or self.default_ttl)
+                pipe.execute()
+
+            duplicates = [bool(is_seen) for is_seen in seen]
+            self.logger.debug(
+                f"URL check of {len(urls)} urls: {sum(duplicates)} already seen"
+            )
+            return duplicates
+
+        except Exception as e:
+            self.logger.error(f"Error checking {len(urls)} urls: {e}")
+            # On error, assume none are seen to avoid missing jobs
+            return [False] * len(urls)
+
+    def get_cached_description(self, job_url: str) -> Optional[str]:
+        """
+        Get a cached job description by URL
+
+        Args:
+            job_url: URL of the job posting
+
+        Returns:
+            Cached description text, or None on miss or error
+        """
+        try:
+            return self.client.get(self._get_description_key(job_url))
+        except Exception as e:
+            self.logger.error(f"Error reading cached description for {job_url}: {e}")
+            return None
+
+    def cache_description(self, job_url: str, description: str,
+                          ttl: Optional[int] = None) -> bool:
+        """
+        Cache a job description by URL
+
+        Detail pages change rarely but are re-fetched on every pagination
+        sweep; caching the parsed text skips the network hop and the HTML
+        parse for warm URLs.
+
+        Args:
+            job_url: URL of the job posting
+            description: Parsed description text
+            ttl: Time-to-live in seconds (defaults to DESCRIPTION_TTL)
+
+        Returns:
+            True if successfully cached, False otherwise
+        """
+        try:
+            self.client.setex(
+                self._get_description_key(job_url),
+                ttl or self.DESCRIPTION_TTL,
+                description
+            )
+            return True
+        except Exception as e:
+            self.logger.error(f"Error caching description for {job_url}: {e}")
+            return False
+
+    @staticmethod
+    def _get_description_key(job_url: str) -> str:
+        """
+        Generate the Redis key for a cached job description
+
+        Args:
+            job_url: URL of the job posting
+
+        Returns:
+            Cache key string in format "jobdesc:{url_digest}"
+        """
+        digest = hashlib.blake2b(job_url.encode('utf-8'), digest_size=16).hexdigest()
+        return f"jobdesc:{digest}"
+
     def _get_company_key(self, company_name: str) -> str:
         """
         Generate a Redis key for a company's job hashset
@@ -192,22 +516,26 @@ class RedisClient:
     def _hash_description(self, description: str) -> str:
         """
         Generate a hash of the job description for deduplication
-        
-        Uses SHA256 to create a unique identifier for the job content.
-        This allows detecting duplicate jobs even when URLs differ.
-        
+
+        Uses BLAKE2b (128-bit) to fingerprint the job content - dedupe
+        needs collision resistance, not cryptographic strength, and
+        blake2b hashes descriptions several times faster than SHA-256
+        while producing half-length Redis fields. This allows detecting
+        duplicate jobs even when URLs differ.
+
         Args:
             description: The job description text
-        
+
         Returns:
             Hexadecimal hash string
         """
-        # Normalize description: lowercase and strip whitespace
-        normalized = description.lower().strip()
-        
-        # Create SHA256 hash
-        hash_object = hashlib.sha256(normalized.encode('utf-8'))
-        return hash_object.hexdigest()
+        # Normalize: encode once, ASCII-lowercase via translate, strip
+        # whitespace - one allocation instead of lower/strip/encode copies
+        normalized = description.encode('utf-8').translate(_ASCII_LOWER).strip()
+
+        hasher = _DESCRIPTION_HASHER.copy()
+        hasher.update(normalized)
+        return hasher.hexdigest()
     
     def clear_cache(self) -> int:
         """
@@ -241,22 +569,28 @@ class RedisClient:
             Dictionary with cache statistics including total jobs and companies
         """
         try:
-            pattern = "job:company:*"
-            company_keys = list(self.client.scan_iter(match=pattern))
-            
-            # Count total jobs across all companies
-            total_jobs = 0
-            for company_key in company_keys:
-                total_jobs += self.client.hlen(company_key)
-            
+            try:
+                # Aggregate server-side in one scripted round-trip
+                total_companies, total_jobs = self._cache_stats_script()
+            except Exception as e:
+                # Server without scripting - fall back to scanning from
+                # the client, one HLEN per company
+                self.logger.debug(f"Scripted cache stats failed ({e}), falling back")
+                pattern = "job:company:*"
+                company_keys = list(self.client.scan_iter(match=pattern))
+                total_companies = len(company_keys)
+                total_jobs = 0
+                for company_key in company_keys:
+                    total_jobs += self.client.hlen(company_key)
+
             return {
-                'total_companies': len(company_keys),
-                'total_cached_jobs': total_jobs,
+                'total_companies': int(total_companies),
+                'total_cached_jobs': int(total_jobs),
                 'redis_host': self.host,
                 'redis_port': self.port,
                 'redis_db': self.db
             }
-            
+
         except Exception as e:
             self.logger.error(f"Error getting cache stats: {e}")
             return {
@@ -266,11 +600,11 @@ class RedisClient:
             }
     
     def close(self):
-        """Close Redis connection"""
+        """Close this client; the shared connection pool stays warm"""
         try:
             if self.client:
                 self.client.close()
-                self.logger.info("Redis connection closed")
+                self.logger.info("Redis client closed (shared pool kept open)")
         except Exception as e:
             self.logger.error(f"Error closing Redis connection: {e}")
     
@@ -1,10 +1,51 @@
 """String matching utilities for job description evaluation"""
 
 import logging
-from typing import List, Set, Dict
+from functools import lru_cache
+from typing import List, Set, Dict, Tuple
 import ahocorasick
 
 
+@lru_cache(maxsize=64)
+def _lower_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Lowercase a keyword tuple once per distinct keyword set
+
+    The same search keywords arrive with every job, so caching the
+    lowered tuple avoids re-allocating the strings per call (and feeds
+    _get_automaton an already-normalized key).
+
+    Args:
+        keywords: Keywords as passed by the caller, as a hashable tuple
+
+    Returns:
+        Tuple of lowercased keywords
+    """
+    return tuple(keyword.lower() for keyword in keywords)
+
+
+@lru_cache(maxsize=64)
+def _get_automaton(keywords: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """
+    Build (or reuse) the Aho-Corasick automaton for a keyword tuple
+
+    The automaton only depends on the keywords, while the matchers are
+    called once per job with the same search keywords - caching saves
+    rebuilding the trie for every description.
+
+    Args:
+        keywords: Normalized keywords, as a hashable tuple
+
+    Returns:
+        Finalized ahocorasick.Automaton for the keywords
+    """
+    automaton = ahocorasick.Automaton()
+    for idx, keyword in enumerate(keywords):
+        automaton.add_word(keyword, (idx, keyword))
+    automaton.make_automaton()
+    return automaton
+
+
 class KeywordMatcher:
     """
     Efficient multi-pattern string matching using Aho-Corasick algorithm
@@ -51,36 +92,28 @@ class KeywordMatcher:
         
         # Normalize text for case-insensitive matching
         search_text = text if case_sensitive else text.lower()
-        search_keywords = keywords if case_sensitive else [k.lower() for k in keywords]
-        
-        # Build Aho-Corasick automaton
-        automaton = ahocorasick.Automaton()
-        
-        # Add keywords to automaton
-        for idx, keyword in enumerate(search_keywords):
-            automaton.add_word(keyword, (idx, keyword))
-        
-        # Finalize automaton (required before search)
-        automaton.make_automaton()
-        
-        # Find all matches
-        found_keywords: Set[str] = set()
+        search_keywords = (
+            tuple(keywords) if case_sensitive else _lower_keywords(tuple(keywords))
+        )
+
+        # Reuse the cached automaton for this keyword set
+        automaton = _get_automaton(search_keywords)
+
+        # Scan until every keyword is covered - descriptions run to
+        # several KB, so stopping at first complete cover halves the
+        # expected scan work for matching jobs
+        remaining: Set[str] = set(search_keywords)
         for end_index, (idx, keyword) in automaton.iter(search_text):
-            found_keywords.add(keyword)
-        
-        # Check if all keywords were found
-        all_found = len(found_keywords) == len(search_keywords)
-        
-        if all_found:
-            self.logger.debug(f"All {len(keywords)} keywords found in text")
-        else:
-            missing = set(search_keywords) - found_keywords
-            self.logger.debug(
-                f"Missing keywords: {missing} "
-                f"(found {len(found_keywords)}/{len(search_keywords)})"
-            )
-        
-        return all_found
+            remaining.discard(keyword)
+            if not remaining:
+                self.logger.debug(f"All {len(keywords)} keywords found in text")
+                return True
+
+        self.logger.debug(
+            f"Missing keywords: {remaining} "
+            f"(found {len(set(search_keywords)) - len(remaining)}/{len(set(search_keywords))})"
+        )
+        return False
     
     def match_any_keywords(
         self, 
@@ -107,14 +140,13 @@ class KeywordMatcher:
         
         # Normalize for case-insensitive matching
         search_text = text if case_sensitive else text.lower()
-        search_keywords = keywords if case_sensitive else [k.lower() for k in keywords]
-        
-        # Build automaton
-        automaton = ahocorasick.Automaton()
-        for idx, keyword in enumerate(search_keywords):
-            automaton.add_word(keyword, (idx, keyword))
-        automaton.make_automaton()
-        
+        search_keywords = (
+            tuple(keywords) if case_sensitive else _lower_keywords(tuple(keywords))
+        )
+
+        # Reuse the cached automaton for this keyword set
+        automaton = _get_automaton(search_keywords)
+
         # Check if any match exists (stop at first match)
         for end_index, (idx, keyword) in automaton.iter(search_text):
             self.logger.debug(f"Found keyword: {keyword}")
@@ -152,14 +184,13 @@ class KeywordMatcher:
         
         # Normalize for case-insensitive matching
         search_text = text if case_sensitive else text.lower()
-        search_keywords = keywords if case_sensitive else [k.lower() for k in keywords]
-        
-        # Build automaton
-        automaton = ahocorasick.Automaton()
-        for idx, keyword in enumerate(search_keywords):
-            automaton.add_word(keyword, (idx, keyword))
-        automaton.make_automaton()
-        
+        search_keywords = (
+            tuple(keywords) if case_sensitive else _lower_keywords(tuple(keywords))
+        )
+
+        # Reuse the cached automaton for this keyword set
+        automaton = _get_automaton(search_keywords)
+
         # Count matches
         matches: Dict[str, int] = {}
         for end_index, (idx, keyword) in automaton.iter(search_text):
@@ -202,14 +233,13 @@ class KeywordMatcher:
         
         # Normalize for case-insensitive matching
         search_text = text if case_sensitive else text.lower()
-        search_keywords = keywords if case_sensitive else [k.lower() for k in keywords]
-        
-        # Build automaton
-        automaton = ahocorasick.Automaton()
-        for idx, keyword in enumerate(search_keywords):
-            automaton.add_word(keyword, (idx, keyword))
-        automaton.make_automaton()
-        
+        search_keywords = (
+            tuple(keywords) if case_sensitive else _lower_keywords(tuple(keywords))
+        )
+
+        # Reuse the cached automaton for this keyword set
+        automaton = _get_automaton(search_keywords)
+
         # Find unique matches
         found_keywords: Set[str] = set()
         for end_index, (idx, keyword) in automaton.iter(search_text):
@@ -0,0 +1,54 @@
+"""Tests for keyword boundary filtering in the job classifier"""
+
+from src.utils.job_classifier import classify_job, extract_tags
+
+
+class TestWordBoundaries:
+    """Boundary filtering around punctuation and embedded tokens"""
+
+    def test_tag_before_sentence_ending_period(self):
+        tags = extract_tags("", "We need experience with Docker.")
+        assert "Docker" in tags
+
+    def test_tags_in_comma_separated_list_with_trailing_period(self):
+        tags = extract_tags("", "Python, Docker, Kubernetes.")
+        assert "Python" in tags
+        assert "Docker" in tags
+        assert "Kubernetes" in tags
+
+    def test_symbolic_keyword_before_period(self):
+        tags = extract_tags("", "Strong knowledge of c++.")
+        assert "C++" in tags
+
+    def test_c_sharp_at_end_of_sentence(self):
+        tags = extract_tags("", "Backend services written in c#.")
+        assert "C#" in tags
+
+    def test_inner_dot_net_still_blocked_in_asp_net(self):
+        # 'asp.net' matches as a whole; the embedded '.net' must not
+        # fire a second, spurious C# hit on its own
+        tags = extract_tags("", "Web apps built with asp.net")
+        assert ".NET" in tags
+
+    def test_embedded_short_keywords_still_rejected(self):
+        tags = extract_tags("", "We use django for rapid development")
+        assert "Go" not in tags
+
+    def test_description_keyword_ending_sentence_scores_category(self):
+        result = classify_job(
+            "Platform Engineer",
+            "You will manage clusters with kubernetes and docker."
+        )
+        assert result.category == "DevOps"
+
+    def test_realistic_description_keeps_all_tags(self):
+        description = (
+            "We are hiring a backend engineer.\n"
+            "You will build services in Python and Go.\n"
+            "Our stack runs on AWS with Kubernetes.\n"
+            "Caching is handled by Redis.\n"
+            "Experience with Docker is a plus."
+        )
+        tags = extract_tags("Backend Engineer", description)
+        for expected in ("Python", "Go", "AWS", "Kubernetes", "Redis", "Docker"):
+            assert expected in tags